@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
+import functools
 import inspect
 from abc import ABC
 from abc import abstractmethod
+from types import MappingProxyType
 from typing import TYPE_CHECKING
 from typing import Any
 from typing import TypeVar
@@ -14,6 +16,7 @@ from pydantic import Field
 
 if TYPE_CHECKING:
     from collections.abc import Callable
+    from collections.abc import Mapping
     from pathlib import Path
 
     from mcp_dap.dap.transport import DAPTransport
@@ -23,6 +26,8 @@ T = TypeVar("T", bound="AdapterConfig")
 # Global registry of adapter classes
 _ADAPTER_REGISTRY: dict[str, type[AdapterConfig]] = {}
 _ADAPTER_ALIASES: dict[str, str] = {}
+_ADAPTER_REGISTRY_VIEW = MappingProxyType(_ADAPTER_REGISTRY)
+_ADAPTER_ALIASES_VIEW = MappingProxyType(_ADAPTER_ALIASES)
 
 
 def adapter(
@@ -55,19 +60,30 @@ def adapter(
     return decorator
 
 
-def get_registered_adapters() -> dict[str, type[AdapterConfig]]:
-    """Get all registered adapter classes."""
-    return _ADAPTER_REGISTRY.copy()
+def get_registered_adapters() -> Mapping[str, type[AdapterConfig]]:
+    """Get a read-only, live view of all registered adapter classes."""
+    return _ADAPTER_REGISTRY_VIEW
 
 
-def get_adapter_aliases() -> dict[str, str]:
-    """Get mapping of aliases to primary adapter names."""
-    return _ADAPTER_ALIASES.copy()
+def get_adapter_aliases() -> Mapping[str, str]:
+    """Get a read-only, live view mapping aliases to primary adapter names."""
+    return _ADAPTER_ALIASES_VIEW
+
+
+@functools.cache
+def _json_schema(model: type[BaseModel]) -> dict[str, Any]:
+    """Generate a model's JSON schema once; callers must not mutate it."""
+    return model.model_json_schema()
 
 
 class BaseLaunchConfig(BaseModel):
     """Base launch configuration shared by all adapters."""
 
+    @classmethod
+    def cached_json_schema(cls) -> dict[str, Any]:
+        """Return the (shared, read-only) JSON schema for this config model."""
+        return _json_schema(cls)
+
     program: str | None = Field(
         default=None,
         description="Path to the program to debug.",
@@ -93,6 +109,11 @@ class BaseLaunchConfig(BaseModel):
 class BaseAttachConfig(BaseModel):
     """Base attach configuration shared by all adapters."""
 
+    @classmethod
+    def cached_json_schema(cls) -> dict[str, Any]:
+        """Return the (shared, read-only) JSON schema for this config model."""
+        return _json_schema(cls)
+
     host: str | None = Field(
         default=None,
         description="Host to connect to (for remote attach).",
@@ -154,8 +175,8 @@ class AdapterConfig(ABC):
             "description": self.description,
             "file_extensions": self.file_extensions,
             "aliases": self.aliases,
-            "launch_config": self.launch_config_class.model_json_schema(),
-            "attach_config": self.attach_config_class.model_json_schema(),
+            "launch_config": self.launch_config_class.cached_json_schema(),
+            "attach_config": self.attach_config_class.cached_json_schema(),
         }
 
     @abstractmethod
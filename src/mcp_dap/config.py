@@ -27,6 +27,7 @@ class ServerConfig(BaseSettings):
 
     Environment variable examples:
         MCP_DAP_LOG_LEVEL=DEBUG
+        MCP_DAP_USE_UVLOOP=false
         MCP_DAP_ADAPTERS__DEBUGPY__ENABLED=false
         MCP_DAP_ADAPTERS__DEBUGPY__PYTHON_PATH=/usr/bin/python3
     """
@@ -56,6 +57,10 @@ class ServerConfig(BaseSettings):
         default="debugpy",
         description="Default adapter when none specified.",
     )
+    use_uvloop: bool = Field(
+        default=True,
+        description="Run the server on uvloop when it is installed.",
+    )
 
     @classmethod
     def settings_customise_sources(
@@ -2,46 +2,82 @@
 
 from __future__ import annotations
 
+from typing import ClassVar
+
 
 class MCPDAPError(Exception):
-    """Base exception for all mcp-dap errors."""
+    """Base exception for all mcp-dap errors.
+
+    Attributes:
+        code: Stable machine-readable error code reported to MCP clients
+    """
+
+    code: ClassVar[str] = "error"
+
+    def to_dict(self) -> dict[str, str]:
+        """Build the JSON error object reported to MCP clients.
+
+        Returns:
+            Dict with the error message and code
+        """
+        return {"error": str(self) if self.args else type(self).__name__, "code": self.code}
 
 
 class DAPError(MCPDAPError):
     """Error from DAP protocol communication."""
 
+    code: ClassVar[str] = "dap_error"
+
 
 class DAPConnectionError(DAPError):
     """Failed to connect to debug adapter."""
 
+    code: ClassVar[str] = "dap_connection_error"
+
 
 class DAPTimeoutError(DAPError):
     """Timeout waiting for DAP response."""
 
+    code: ClassVar[str] = "dap_timeout"
+
 
 class DAPProtocolError(DAPError):
     """Invalid DAP message or protocol violation."""
 
+    code: ClassVar[str] = "dap_protocol_error"
+
 
 class SessionError(MCPDAPError):
     """Error related to debug session management."""
 
+    code: ClassVar[str] = "session_error"
+
 
 class SessionNotFoundError(SessionError):
     """Debug session not found."""
 
+    code: ClassVar[str] = "session_not_found"
+
 
 class SessionAlreadyExistsError(SessionError):
     """Debug session already exists with this ID."""
 
+    code: ClassVar[str] = "session_already_exists"
+
 
 class AdapterError(MCPDAPError):
     """Error related to debug adapter configuration or launch."""
 
+    code: ClassVar[str] = "adapter_error"
+
 
 class AdapterNotFoundError(AdapterError):
     """Debug adapter not found or not configured."""
 
+    code: ClassVar[str] = "adapter_not_found"
+
 
 class AdapterLaunchError(AdapterError):
     """Failed to launch debug adapter process."""
+
+    code: ClassVar[str] = "adapter_launch_failed"
@@ -3,27 +3,46 @@
 from __future__ import annotations
 
 import asyncio
-import json
+import functools
 from typing import TYPE_CHECKING
 from typing import Any
 
+import orjson
 from mcp.server import Server
 from mcp.server.stdio import stdio_server
 from mcp.types import EmbeddedResource
 from mcp.types import Resource
+from mcp.types import ResourceTemplate
 from mcp.types import TextContent
 from mcp.types import Tool
+from pydantic import AnyUrl
 from pydantic import BaseModel
 from pydantic import ConfigDict
 from pydantic import Field
+from pydantic import TypeAdapter
 
+from mcp_dap.config import get_config
 from mcp_dap.exceptions import MCPDAPError
 from mcp_dap.exceptions import SessionNotFoundError
 from mcp_dap.session import SessionManager
+from mcp_dap.types import Breakpoint
+from mcp_dap.types import OutputEvent
+from mcp_dap.types import Scope
+from mcp_dap.types import SessionInfo
 from mcp_dap.types import SessionState
+from mcp_dap.types import StackFrame
+from mcp_dap.types import Thread
+from mcp_dap.types import Variable
 
 if TYPE_CHECKING:
+    from collections.abc import Awaitable
+    from collections.abc import Callable
+
     from mcp_dap.dap.messages import DAPEvent
+    from mcp_dap.session import DebugSession
+    from mcp_dap.types import StoppedEvent
+
+    ToolHandler = Callable[[dict[str, Any]], Awaitable[dict[str, Any]]]
 
 # === Tool Input Models ===
 
@@ -123,9 +142,171 @@ class EvaluateInput(BaseModel):
     context: str = Field(default="repl", description="Context: repl, watch, hover")
 
 
+# === Pre-bound Validators ===
+# Calling the schema validator directly skips the model_validate() classmethod
+# indirection on every tool call.
+
+_VALIDATE_LAUNCH = LaunchInput.__pydantic_validator__.validate_python
+_VALIDATE_ATTACH = AttachInput.__pydantic_validator__.validate_python
+_VALIDATE_SET_BREAKPOINTS = SetBreakpointsInput.__pydantic_validator__.validate_python
+_VALIDATE_CLEAR_BREAKPOINTS = ClearBreakpointsInput.__pydantic_validator__.validate_python
+_VALIDATE_STACK_TRACE = StackTraceInput.__pydantic_validator__.validate_python
+_VALIDATE_SCOPES = ScopesInput.__pydantic_validator__.validate_python
+_VALIDATE_VARIABLES = VariablesInput.__pydantic_validator__.validate_python
+_VALIDATE_EVALUATE = EvaluateInput.__pydantic_validator__.validate_python
+
+
+def _session_id_arg(arguments: dict[str, Any]) -> str:
+    """Read the required session_id argument without building an input model.
+
+    SessionInput and ExecutionInput still define the published schemas; the
+    tools that only need these fields skip model validation entirely.
+    """
+    session_id = arguments.get("session_id")
+    if not isinstance(session_id, str):
+        raise MCPDAPError("'session_id' is required and must be a string")
+    return session_id
+
+
+def _thread_id_arg(arguments: dict[str, Any]) -> int | None:
+    """Read the optional thread_id argument without building an input model."""
+    thread_id = arguments.get("thread_id")
+    if thread_id is None or (isinstance(thread_id, int) and not isinstance(thread_id, bool)):
+        return thread_id
+    raise MCPDAPError("'thread_id' must be an integer")
+
+
+# === Cached List Serializers ===
+# Dumping a whole list through one TypeAdapter lets pydantic-core walk it in a
+# single call instead of invoking model_dump() per element.
+
+_DUMP_BREAKPOINTS = TypeAdapter(list[Breakpoint]).dump_python
+_DUMP_THREADS = TypeAdapter(list[Thread]).dump_python
+_DUMP_FRAMES = TypeAdapter(list[StackFrame]).dump_python
+_DUMP_SCOPES = TypeAdapter(list[Scope]).dump_python
+_DUMP_VARIABLES = TypeAdapter(list[Variable]).dump_python
+_DUMP_OUTPUT = TypeAdapter(list[OutputEvent]).dump_python
+_DUMP_SESSIONS = TypeAdapter(list[SessionInfo]).dump_python
+
+
+# === Resource Listings ===
+
+# (path segment, name suffix, description) for each per-session resource
+_SESSION_RESOURCE_TEMPLATES: tuple[tuple[str, str, str], ...] = (
+    ("state", "State", "Current debug session state"),
+    ("threads", "Threads", "Threads in debug session"),
+    ("breakpoints", "Breakpoints", "Active breakpoints"),
+)
+
+
+def _resource(uri: str, name: str, description: str) -> Resource:
+    """Build a JSON resource descriptor from trusted internal strings.
+
+    Uses ``model_construct`` to skip field validation; only the URI is
+    parsed, so it serializes as the ``AnyUrl`` the model expects.
+
+    Args:
+        uri: Resource URI
+        name: Human-readable name
+        description: Resource description
+
+    Returns:
+        The resource descriptor
+    """
+    return Resource.model_construct(
+        uri=AnyUrl(uri),
+        name=name,
+        description=description,
+        mimeType="application/json",
+    )
+
+
+_STATIC_RESOURCES: tuple[Resource, ...] = (
+    _resource(
+        "debug://adapters",
+        "Available Debug Adapters",
+        "List of available debug adapters and their capabilities",
+    ),
+    _resource("debug://sessions", "Debug Sessions", "List of active debug sessions"),
+)
+
+_SCHEMA_RESOURCE_TEMPLATE = ResourceTemplate(
+    uriTemplate="debug://schema/{tool}",
+    name="Tool Input Schema",
+    description="Full JSON Schema for a tool's arguments",
+    mimeType="application/json",
+)
+
+
+def _session_resources(sid: str) -> list[Resource]:
+    """Build the resources exposed for a single debug session.
+
+    Args:
+        sid: Session ID
+
+    Returns:
+        The state, threads and breakpoints resources for the session
+    """
+    short_id = sid[:8]
+    return [
+        _resource(f"debug://{sid}/{path}", f"Session {short_id} {suffix}", description)
+        for path, suffix, description in _SESSION_RESOURCE_TEMPLATES
+    ]
+
+
+def _dump(obj: Any) -> str:
+    """Serialize a tool or resource result to indented JSON text."""
+    return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+
+
 # === Server Implementation ===
 
 
+def _error_message(e: Exception) -> str:
+    """Describe an exception for a tool error response.
+
+    Falls back to the exception type name when it carries no message, so
+    bare exceptions never produce an empty error string.
+
+    Args:
+        e: The exception raised by a tool handler
+
+    Returns:
+        The error message
+    """
+    return str(e) if e.args else type(e).__name__
+
+
+@functools.lru_cache(maxsize=256)
+def _error_content(error: str, code: str) -> TextContent:
+    """Serialize an error object into text content, once per message and code.
+
+    Args:
+        error: The error message
+        code: Machine-readable error code
+
+    Returns:
+        Text content holding the JSON error object
+    """
+    return TextContent(type="text", text=_dump({"error": error, "code": code}))
+
+
+def _error_response(error: str, code: str) -> list[TextContent | EmbeddedResource]:
+    """Build the tool result content for an error.
+
+    Repeated errors (unknown tools, missing sessions) reuse the content
+    serialized for the first occurrence.
+
+    Args:
+        error: The error message
+        code: Machine-readable error code
+
+    Returns:
+        A single text content item holding the JSON error object
+    """
+    return [_error_content(error, code)]
+
+
 class MCPDAPServer:
     """MCP server exposing DAP debugging capabilities."""
 
@@ -137,109 +318,145 @@ class MCPDAPServer:
         # Register event callback for logging
         self.session_manager.add_event_callback(self._on_debug_event)
 
+        # Per-session resource listings, built on first list_resources call
+        self._resource_cache: dict[str, list[Resource]] = {}
+        # Session ID -> (threads generation, serialized debug://<sid>/threads)
+        self._threads_json_cache: dict[str, tuple[int, str]] = {}
+
+        # Tool name -> handler, so dispatch is a single dict lookup
+        self._tool_handlers: dict[str, ToolHandler] = {
+            "debug_launch": self._tool_launch,
+            "debug_attach": self._tool_attach,
+            "debug_disconnect": self._tool_disconnect,
+            "debug_set_breakpoints": self._tool_set_breakpoints,
+            "debug_clear_breakpoints": self._tool_clear_breakpoints,
+            "debug_continue": self._tool_continue,
+            "debug_step_over": self._tool_step_over,
+            "debug_step_into": self._tool_step_into,
+            "debug_step_out": self._tool_step_out,
+            "debug_pause": self._tool_pause,
+            "debug_get_threads": self._tool_get_threads,
+            "debug_get_stack_trace": self._tool_get_stack_trace,
+            "debug_get_scopes": self._tool_get_scopes,
+            "debug_get_variables": self._tool_get_variables,
+            "debug_evaluate": self._tool_evaluate,
+            "debug_get_pending_events": self._tool_get_pending_events,
+            "debug_get_output": self._tool_get_output,
+        }
+
         # Register handlers
         self._register_tools()
         self._register_resources()
 
+    def _build_tools(self) -> list[Tool]:
+        """Build the MCP tool definitions."""
+        return [
+            Tool(
+                name="debug_launch",
+                description=(
+                    "Launch a program for debugging. Returns session_id for subsequent operations. "
+                    "For Rust: use adapter='rust' with either 'program' (pre-built binary) or "
+                    "'cargo_args' (e.g., ['build', '--bin', 'myapp']) to build and debug."
+                ),
+                inputSchema=LaunchInput.model_json_schema(),
+            ),
+            Tool(
+                name="debug_attach",
+                description=(
+                    "Attach to a running debug server or process. Returns session_id for subsequent operations. "
+                    "For Python: provide host/port. For Rust: provide pid or program name."
+                ),
+                inputSchema=AttachInput.model_json_schema(),
+            ),
+            Tool(
+                name="debug_disconnect",
+                description="Disconnect from a debug session and optionally terminate the debuggee.",
+                inputSchema=SessionInput.model_json_schema(),
+            ),
+            Tool(
+                name="debug_set_breakpoints",
+                description="Set breakpoints in a source file. Replaces all existing breakpoints in that file.",
+                inputSchema=SetBreakpointsInput.model_json_schema(),
+            ),
+            Tool(
+                name="debug_clear_breakpoints",
+                description="Clear all breakpoints in a source file.",
+                inputSchema=ClearBreakpointsInput.model_json_schema(),
+            ),
+            Tool(
+                name="debug_continue",
+                description="Continue execution. Blocks until execution stops (breakpoint, exception, etc.).",
+                inputSchema=ExecutionInput.model_json_schema(),
+            ),
+            Tool(
+                name="debug_step_over",
+                description="Step over to the next line. Blocks until step completes.",
+                inputSchema=ExecutionInput.model_json_schema(),
+            ),
+            Tool(
+                name="debug_step_into",
+                description="Step into function call. Blocks until step completes.",
+                inputSchema=ExecutionInput.model_json_schema(),
+            ),
+            Tool(
+                name="debug_step_out",
+                description="Step out of current function. Blocks until step completes.",
+                inputSchema=ExecutionInput.model_json_schema(),
+            ),
+            Tool(
+                name="debug_pause",
+                description="Pause execution.",
+                inputSchema=ExecutionInput.model_json_schema(),
+            ),
+            Tool(
+                name="debug_get_threads",
+                description="Get all threads in the debuggee.",
+                inputSchema=SessionInput.model_json_schema(),
+            ),
+            Tool(
+                name="debug_get_stack_trace",
+                description="Get the call stack for a thread.",
+                inputSchema=StackTraceInput.model_json_schema(),
+            ),
+            Tool(
+                name="debug_get_scopes",
+                description="Get variable scopes for a stack frame (locals, globals, etc.).",
+                inputSchema=ScopesInput.model_json_schema(),
+            ),
+            Tool(
+                name="debug_get_variables",
+                description="Get variables for a scope or expandable variable.",
+                inputSchema=VariablesInput.model_json_schema(),
+            ),
+            Tool(
+                name="debug_evaluate",
+                description="Evaluate an expression in the debuggee context.",
+                inputSchema=EvaluateInput.model_json_schema(),
+            ),
+            Tool(
+                name="debug_get_pending_events",
+                description=(
+                    "Get pending debug events (stopped, output, etc.) since last call. "
+                    "Returns at most 256 events; 'truncated' is true when more remain."
+                ),
+                inputSchema=SessionInput.model_json_schema(),
+            ),
+            Tool(
+                name="debug_get_output",
+                description="Get debuggee output (stdout/stderr) since last call.",
+                inputSchema=SessionInput.model_json_schema(),
+            ),
+        ]
+
     def _register_tools(self) -> None:
         """Register all MCP tools."""
+        # Tool definitions and their schemas never change, so build them once
+        tools = self._build_tools()
+        self._tool_schemas: dict[str, str] = {tool.name: _dump(tool.inputSchema) for tool in tools}
 
         @self.server.list_tools()  # type: ignore[no-untyped-call, untyped-decorator]
         async def list_tools() -> list[Tool]:
-            return [
-                Tool(
-                    name="debug_launch",
-                    description=(
-                        "Launch a program for debugging. Returns session_id for subsequent operations. "
-                        "For Rust: use adapter='rust' with either 'program' (pre-built binary) or "
-                        "'cargo_args' (e.g., ['build', '--bin', 'myapp']) to build and debug."
-                    ),
-                    inputSchema=LaunchInput.model_json_schema(),
-                ),
-                Tool(
-                    name="debug_attach",
-                    description=(
-                        "Attach to a running debug server or process. Returns session_id for subsequent operations. "
-                        "For Python: provide host/port. For Rust: provide pid or program name."
-                    ),
-                    inputSchema=AttachInput.model_json_schema(),
-                ),
-                Tool(
-                    name="debug_disconnect",
-                    description="Disconnect from a debug session and optionally terminate the debuggee.",
-                    inputSchema=SessionInput.model_json_schema(),
-                ),
-                Tool(
-                    name="debug_set_breakpoints",
-                    description="Set breakpoints in a source file. Replaces all existing breakpoints in that file.",
-                    inputSchema=SetBreakpointsInput.model_json_schema(),
-                ),
-                Tool(
-                    name="debug_clear_breakpoints",
-                    description="Clear all breakpoints in a source file.",
-                    inputSchema=ClearBreakpointsInput.model_json_schema(),
-                ),
-                Tool(
-                    name="debug_continue",
-                    description="Continue execution. Blocks until execution stops (breakpoint, exception, etc.).",
-                    inputSchema=ExecutionInput.model_json_schema(),
-                ),
-                Tool(
-                    name="debug_step_over",
-                    description="Step over to the next line. Blocks until step completes.",
-                    inputSchema=ExecutionInput.model_json_schema(),
-                ),
-                Tool(
-                    name="debug_step_into",
-                    description="Step into function call. Blocks until step completes.",
-                    inputSchema=ExecutionInput.model_json_schema(),
-                ),
-                Tool(
-                    name="debug_step_out",
-                    description="Step out of current function. Blocks until step completes.",
-                    inputSchema=ExecutionInput.model_json_schema(),
-                ),
-                Tool(
-                    name="debug_pause",
-                    description="Pause execution.",
-                    inputSchema=ExecutionInput.model_json_schema(),
-                ),
-                Tool(
-                    name="debug_get_threads",
-                    description="Get all threads in the debuggee.",
-                    inputSchema=SessionInput.model_json_schema(),
-                ),
-                Tool(
-                    name="debug_get_stack_trace",
-                    description="Get the call stack for a thread.",
-                    inputSchema=StackTraceInput.model_json_schema(),
-                ),
-                Tool(
-                    name="debug_get_scopes",
-                    description="Get variable scopes for a stack frame (locals, globals, etc.).",
-                    inputSchema=ScopesInput.model_json_schema(),
-                ),
-                Tool(
-                    name="debug_get_variables",
-                    description="Get variables for a scope or expandable variable.",
-                    inputSchema=VariablesInput.model_json_schema(),
-                ),
-                Tool(
-                    name="debug_evaluate",
-                    description="Evaluate an expression in the debuggee context.",
-                    inputSchema=EvaluateInput.model_json_schema(),
-                ),
-                Tool(
-                    name="debug_get_pending_events",
-                    description="Get pending debug events (stopped, output, etc.) since last call.",
-                    inputSchema=SessionInput.model_json_schema(),
-                ),
-                Tool(
-                    name="debug_get_output",
-                    description="Get debuggee output (stdout/stderr) since last call.",
-                    inputSchema=SessionInput.model_json_schema(),
-                ),
-            ]
+            return tools
 
         @self.server.call_tool()  # type: ignore[untyped-decorator]
         async def call_tool(
@@ -247,181 +464,203 @@ class MCPDAPServer:
         ) -> list[TextContent | EmbeddedResource]:
             try:
                 result = await self._handle_tool(name, arguments)
-                return [TextContent(type="text", text=json.dumps(result, indent=2))]
+                return [TextContent(type="text", text=_dump(result))]
             except MCPDAPError as e:
-                return [TextContent(type="text", text=json.dumps({"error": str(e)}))]
+                return _error_response(**e.to_dict())
             except Exception as e:
-                return [
-                    TextContent(type="text", text=json.dumps({"error": f"Internal error: {e}"}))
-                ]
+                return _error_response(f"Internal error: {_error_message(e)}", "internal_error")
 
     async def _handle_tool(self, name: str, arguments: dict[str, Any]) -> dict[str, Any]:
         """Handle a tool call."""
-
-        if name == "debug_launch":
-            launch_inp = LaunchInput.model_validate(arguments)
-
-            # Validate: either program or cargo_args must be provided
-            if launch_inp.program is None and launch_inp.cargo_args is None:
-                raise MCPDAPError("Either 'program' or 'cargo_args' must be provided")
-
-            session = await self.session_manager.create_session(
-                adapter_name=launch_inp.adapter,
-                program=launch_inp.program,
-                cwd=launch_inp.cwd,
-                env=launch_inp.env or None,
-            )
-            await session.launch(
-                program=launch_inp.program,
-                args=launch_inp.args,
-                cwd=launch_inp.cwd,
-                env=launch_inp.env or None,
-                stop_on_entry=launch_inp.stop_on_entry,
-                cargo_args=launch_inp.cargo_args,
-            )
-            return {
-                "session_id": session.session_id,
-                "adapter": launch_inp.adapter,
-                "program": session._program,  # Use actual program (may be from cargo build)
-                "state": session.state.value,
-            }
-
-        if name == "debug_attach":
-            attach_inp = AttachInput.model_validate(arguments)
-            # Extract any extra arguments for the adapter
-            kwargs = attach_inp.model_dump(exclude={"adapter", "host", "port"})
-
-            session = await self.session_manager.create_session(
-                adapter_name=attach_inp.adapter,
-                host=attach_inp.host,
-                port=attach_inp.port,
-                **kwargs,
-            )
-            await session.attach(
-                host=attach_inp.host,
-                port=attach_inp.port,
-                **kwargs,
-            )
-            return {
-                "session_id": session.session_id,
-                "adapter": attach_inp.adapter,
-                "host": attach_inp.host,
-                "port": attach_inp.port,
-                "pid": attach_inp.pid,
-                "state": session.state.value,
-            }
-
-        if name == "debug_disconnect":
-            session_inp = SessionInput.model_validate(arguments)
-            await self.session_manager.close_session(session_inp.session_id)
-            return {"success": True, "session_id": session_inp.session_id}
-
-        if name == "debug_set_breakpoints":
-            bp_inp = SetBreakpointsInput.model_validate(arguments)
-            session = await self.session_manager.get_session(bp_inp.session_id)
-            breakpoints = await session.set_breakpoints(bp_inp.file, bp_inp.breakpoints)
-            return {
-                "file": bp_inp.file,
-                "breakpoints": [bp.model_dump() for bp in breakpoints],
-            }
-
-        if name == "debug_clear_breakpoints":
-            clear_inp = ClearBreakpointsInput.model_validate(arguments)
-            session = await self.session_manager.get_session(clear_inp.session_id)
-            await session.clear_breakpoints(clear_inp.file)
-            return {"file": clear_inp.file, "cleared": True}
-
-        if name == "debug_continue":
-            exec_inp = ExecutionInput.model_validate(arguments)
-            session = await self.session_manager.get_session(exec_inp.session_id)
-            stopped = await session.continue_execution(exec_inp.thread_id, wait=True)
-            return self._stopped_result(session, stopped)
-
-        if name == "debug_step_over":
-            exec_inp = ExecutionInput.model_validate(arguments)
-            session = await self.session_manager.get_session(exec_inp.session_id)
-            stopped = await session.step_over(exec_inp.thread_id, wait=True)
-            return self._stopped_result(session, stopped)
-
-        if name == "debug_step_into":
-            exec_inp = ExecutionInput.model_validate(arguments)
-            session = await self.session_manager.get_session(exec_inp.session_id)
-            stopped = await session.step_into(exec_inp.thread_id, wait=True)
-            return self._stopped_result(session, stopped)
-
-        if name == "debug_step_out":
-            exec_inp = ExecutionInput.model_validate(arguments)
-            session = await self.session_manager.get_session(exec_inp.session_id)
-            stopped = await session.step_out(exec_inp.thread_id, wait=True)
-            return self._stopped_result(session, stopped)
-
-        if name == "debug_pause":
-            exec_inp = ExecutionInput.model_validate(arguments)
-            session = await self.session_manager.get_session(exec_inp.session_id)
-            await session.pause(exec_inp.thread_id)
-            return {"paused": True}
-
-        if name == "debug_get_threads":
-            session_inp = SessionInput.model_validate(arguments)
-            session = await self.session_manager.get_session(session_inp.session_id)
-            threads = await session.get_threads()
-            return {"threads": [t.model_dump() for t in threads]}
-
-        if name == "debug_get_stack_trace":
-            stack_inp = StackTraceInput.model_validate(arguments)
-            session = await self.session_manager.get_session(stack_inp.session_id)
-            frames = await session.get_stack_trace(stack_inp.thread_id, levels=stack_inp.levels)
-            return {"frames": [f.model_dump() for f in frames]}
-
-        if name == "debug_get_scopes":
-            scopes_inp = ScopesInput.model_validate(arguments)
-            session = await self.session_manager.get_session(scopes_inp.session_id)
-            scopes = await session.get_scopes(scopes_inp.frame_id)
-            return {"scopes": [s.model_dump() for s in scopes]}
-
-        if name == "debug_get_variables":
-            vars_inp = VariablesInput.model_validate(arguments)
-            session = await self.session_manager.get_session(vars_inp.session_id)
-            variables = await session.get_variables(vars_inp.variables_reference, vars_inp.filter)
-            return {"variables": [v.model_dump() for v in variables]}
-
-        if name == "debug_evaluate":
-            eval_inp = EvaluateInput.model_validate(arguments)
-            session = await self.session_manager.get_session(eval_inp.session_id)
-            result = await session.evaluate(
-                eval_inp.expression, eval_inp.frame_id, eval_inp.context
-            )
-            return result.model_dump()
-
-        if name == "debug_get_pending_events":
-            session_inp = SessionInput.model_validate(arguments)
-            session = await self.session_manager.get_session(session_inp.session_id)
-            events = session.get_pending_events()
-            return {"events": [{"event": e.event, "body": e.body} for e in events]}
-
-        if name == "debug_get_output":
-            session_inp = SessionInput.model_validate(arguments)
-            session = await self.session_manager.get_session(session_inp.session_id)
-            output = session.get_output()
-            return {"output": [o.model_dump() for o in output]}
-
-        raise MCPDAPError(f"Unknown tool: {name}")
-
-    def _stopped_result(self, session: Any, stopped: Any) -> dict[str, Any]:
+        handler = self._tool_handlers.get(name)
+        if handler is None:
+            raise MCPDAPError(f"Unknown tool: {name}")
+        return await handler(arguments)
+
+    async def _tool_launch(self, arguments: dict[str, Any]) -> dict[str, Any]:
+        """Handle the debug_launch tool."""
+        launch_inp = _VALIDATE_LAUNCH(arguments)
+
+        # Validate: either program or cargo_args must be provided
+        if launch_inp.program is None and launch_inp.cargo_args is None:
+            raise MCPDAPError("Either 'program' or 'cargo_args' must be provided")
+
+        session = await self.session_manager.create_session(
+            adapter_name=launch_inp.adapter,
+            program=launch_inp.program,
+            cwd=launch_inp.cwd,
+            env=launch_inp.env or None,
+        )
+        await session.launch(
+            program=launch_inp.program,
+            args=launch_inp.args,
+            cwd=launch_inp.cwd,
+            env=launch_inp.env or None,
+            stop_on_entry=launch_inp.stop_on_entry,
+            cargo_args=launch_inp.cargo_args,
+        )
+        return {
+            "session_id": session.session_id,
+            "adapter": launch_inp.adapter,
+            "program": session._program,  # Use actual program (may be from cargo build)
+            "state": session.state,
+        }
+
+    async def _tool_attach(self, arguments: dict[str, Any]) -> dict[str, Any]:
+        """Handle the debug_attach tool."""
+        attach_inp = _VALIDATE_ATTACH(arguments)
+        # pid plus any extra arguments for the adapter, read without a model_dump walk
+        kwargs: dict[str, Any] = {"pid": attach_inp.pid}
+        if attach_inp.__pydantic_extra__:
+            kwargs.update(attach_inp.__pydantic_extra__)
+
+        session = await self.session_manager.create_session(
+            adapter_name=attach_inp.adapter,
+            host=attach_inp.host,
+            port=attach_inp.port,
+            **kwargs,
+        )
+        await session.attach(
+            host=attach_inp.host,
+            port=attach_inp.port,
+            **kwargs,
+        )
+        return {
+            "session_id": session.session_id,
+            "adapter": attach_inp.adapter,
+            "host": attach_inp.host,
+            "port": attach_inp.port,
+            "pid": attach_inp.pid,
+            "state": session.state,
+        }
+
+    async def _tool_disconnect(self, arguments: dict[str, Any]) -> dict[str, Any]:
+        """Handle the debug_disconnect tool."""
+        session_id = _session_id_arg(arguments)
+        await self.session_manager.close_session(session_id)
+        self._resource_cache.pop(session_id, None)
+        self._threads_json_cache.pop(session_id, None)
+        return {"success": True, "session_id": session_id}
+
+    async def _tool_set_breakpoints(self, arguments: dict[str, Any]) -> dict[str, Any]:
+        """Handle the debug_set_breakpoints tool."""
+        bp_inp = _VALIDATE_SET_BREAKPOINTS(arguments)
+        session = self._get_session(bp_inp.session_id)
+        breakpoints = await session.set_breakpoints(bp_inp.file, bp_inp.breakpoints)
+        return {
+            "file": bp_inp.file,
+            "breakpoints": _DUMP_BREAKPOINTS(breakpoints),
+        }
+
+    async def _tool_clear_breakpoints(self, arguments: dict[str, Any]) -> dict[str, Any]:
+        """Handle the debug_clear_breakpoints tool."""
+        clear_inp = _VALIDATE_CLEAR_BREAKPOINTS(arguments)
+        session = self._get_session(clear_inp.session_id)
+        await session.clear_breakpoints(clear_inp.file)
+        return {"file": clear_inp.file, "cleared": True}
+
+    async def _tool_continue(self, arguments: dict[str, Any]) -> dict[str, Any]:
+        """Handle the debug_continue tool."""
+        session = self._get_session(_session_id_arg(arguments))
+        stopped = await session.continue_execution(_thread_id_arg(arguments), wait=True)
+        return self._stopped_result(session, stopped)
+
+    async def _tool_step_over(self, arguments: dict[str, Any]) -> dict[str, Any]:
+        """Handle the debug_step_over tool."""
+        session = self._get_session(_session_id_arg(arguments))
+        stopped = await session.step_over(_thread_id_arg(arguments), wait=True)
+        return self._stopped_result(session, stopped)
+
+    async def _tool_step_into(self, arguments: dict[str, Any]) -> dict[str, Any]:
+        """Handle the debug_step_into tool."""
+        session = self._get_session(_session_id_arg(arguments))
+        stopped = await session.step_into(_thread_id_arg(arguments), wait=True)
+        return self._stopped_result(session, stopped)
+
+    async def _tool_step_out(self, arguments: dict[str, Any]) -> dict[str, Any]:
+        """Handle the debug_step_out tool."""
+        session = self._get_session(_session_id_arg(arguments))
+        stopped = await session.step_out(_thread_id_arg(arguments), wait=True)
+        return self._stopped_result(session, stopped)
+
+    async def _tool_pause(self, arguments: dict[str, Any]) -> dict[str, Any]:
+        """Handle the debug_pause tool."""
+        session = self._get_session(_session_id_arg(arguments))
+        await session.pause(_thread_id_arg(arguments))
+        return {"paused": True}
+
+    async def _tool_get_threads(self, arguments: dict[str, Any]) -> dict[str, Any]:
+        """Handle the debug_get_threads tool."""
+        session = self._get_session(_session_id_arg(arguments))
+        threads = await session.get_threads()
+        return {"threads": _DUMP_THREADS(threads)}
+
+    async def _tool_get_stack_trace(self, arguments: dict[str, Any]) -> dict[str, Any]:
+        """Handle the debug_get_stack_trace tool."""
+        stack_inp = _VALIDATE_STACK_TRACE(arguments)
+        session = self._get_session(stack_inp.session_id)
+        frames = await session.get_stack_trace(stack_inp.thread_id, levels=stack_inp.levels)
+        return {"frames": _DUMP_FRAMES(frames)}
+
+    async def _tool_get_scopes(self, arguments: dict[str, Any]) -> dict[str, Any]:
+        """Handle the debug_get_scopes tool."""
+        scopes_inp = _VALIDATE_SCOPES(arguments)
+        session = self._get_session(scopes_inp.session_id)
+        scopes = await session.get_scopes(scopes_inp.frame_id)
+        return {"scopes": _DUMP_SCOPES(scopes)}
+
+    async def _tool_get_variables(self, arguments: dict[str, Any]) -> dict[str, Any]:
+        """Handle the debug_get_variables tool."""
+        vars_inp = _VALIDATE_VARIABLES(arguments)
+        session = self._get_session(vars_inp.session_id)
+        variables = await session.get_variables(vars_inp.variables_reference, vars_inp.filter)
+        return {"variables": _DUMP_VARIABLES(variables)}
+
+    async def _tool_evaluate(self, arguments: dict[str, Any]) -> dict[str, Any]:
+        """Handle the debug_evaluate tool."""
+        eval_inp = _VALIDATE_EVALUATE(arguments)
+        session = self._get_session(eval_inp.session_id)
+        result = await session.evaluate(eval_inp.expression, eval_inp.frame_id, eval_inp.context)
+        return result.model_dump()
+
+    async def _tool_get_pending_events(self, arguments: dict[str, Any]) -> dict[str, Any]:
+        """Handle the debug_get_pending_events tool."""
+        session = self._get_session(_session_id_arg(arguments))
+        events = session.get_pending_events()
+        return {
+            "events": [{"event": e.event, "body": e.body} for e in events],
+            "truncated": session.has_pending_events,
+        }
+
+    async def _tool_get_output(self, arguments: dict[str, Any]) -> dict[str, Any]:
+        """Handle the debug_get_output tool."""
+        session = self._get_session(_session_id_arg(arguments))
+        output = session.get_output()
+        return {"output": _DUMP_OUTPUT(output)}
+
+    def _get_session(self, session_id: str) -> DebugSession:
+        """Look up a session synchronously, raising if it does not exist."""
+        session = self.session_manager.get_session_nowait(session_id)
+        if session is None:
+            raise SessionNotFoundError(f"Session not found: {session_id}")
+        return session
+
+    def _stopped_result(
+        self, session: DebugSession, stopped: StoppedEvent | None
+    ) -> dict[str, Any]:
         """Build result for stopped execution."""
-        result: dict[str, Any] = {"state": session.state.value}
-
-        if session.state == SessionState.TERMINATED:
-            result["terminated"] = True
-            return result
+        state = session.state
+        if state is SessionState.TERMINATED:
+            return {"state": state, "terminated": True}
 
         if stopped:
-            result["reason"] = stopped.reason.value
-            result["thread_id"] = stopped.thread_id
-        else:
-            result["timeout"] = True
+            return {
+                "state": state,
+                "reason": stopped.reason,
+                "thread_id": stopped.thread_id,
+            }
 
-        return result
+        return {"state": state, "timeout": True}
 
     def _get_adapter_info(self) -> dict[str, Any]:
         """Get information about available debug adapters."""
@@ -432,85 +671,80 @@ class MCPDAPServer:
 
         @self.server.list_resources()  # type: ignore[no-untyped-call, untyped-decorator]
         async def list_resources() -> list[Resource]:
-            resources: list[Resource] = [
-                Resource(
-                    uri="debug://adapters",  # type: ignore[arg-type]
-                    name="Available Debug Adapters",
-                    description="List of available debug adapters and their capabilities",
-                    mimeType="application/json",
-                ),
-                Resource(
-                    uri="debug://sessions",  # type: ignore[arg-type]
-                    name="Debug Sessions",
-                    description="List of active debug sessions",
-                    mimeType="application/json",
-                ),
-            ]
-
-            # Add per-session resources
-            for session_info in self.session_manager.list_sessions():
-                sid = session_info.session_id
-                resources.extend(
-                    [
-                        Resource(
-                            uri=f"debug://{sid}/state",  # type: ignore[arg-type]
-                            name=f"Session {sid[:8]} State",
-                            description="Current debug session state",
-                            mimeType="application/json",
-                        ),
-                        Resource(
-                            uri=f"debug://{sid}/threads",  # type: ignore[arg-type]
-                            name=f"Session {sid[:8]} Threads",
-                            description="Threads in debug session",
-                            mimeType="application/json",
-                        ),
-                        Resource(
-                            uri=f"debug://{sid}/breakpoints",  # type: ignore[arg-type]
-                            name=f"Session {sid[:8]} Breakpoints",
-                            description="Active breakpoints",
-                            mimeType="application/json",
-                        ),
-                    ]
-                )
+            session_ids = self.session_manager.list_session_ids()
+            cache = self._resource_cache
+            if len(cache) > len(session_ids):
+                # Drop entries for sessions closed outside debug_disconnect
+                for stale in cache.keys() - set(session_ids):
+                    del cache[stale]
+
+            resources = list(_STATIC_RESOURCES)
+            for sid in session_ids:
+                session_resources = cache.get(sid)
+                if session_resources is None:
+                    session_resources = cache[sid] = _session_resources(sid)
+                resources.extend(session_resources)
 
             return resources
 
+        @self.server.list_resource_templates()  # type: ignore[no-untyped-call, untyped-decorator]
+        async def list_resource_templates() -> list[ResourceTemplate]:
+            return [_SCHEMA_RESOURCE_TEMPLATE]
+
         @self.server.read_resource()  # type: ignore[no-untyped-call, untyped-decorator]
-        async def read_resource(uri: str) -> str:
+        async def read_resource(uri: AnyUrl | str) -> str:
+            # The MCP SDK hands over a parsed AnyUrl; compare against its text form
+            uri = str(uri)
             if uri == "debug://adapters":
-                return json.dumps(self._get_adapter_info(), indent=2)
+                return _dump(self._get_adapter_info())
 
             if uri == "debug://sessions":
                 sessions = self.session_manager.list_sessions()
-                return json.dumps([s.model_dump() for s in sessions], indent=2)
+                return _dump(_DUMP_SESSIONS(sessions))
 
-            # Parse session-specific URIs
-            if uri.startswith("debug://"):
-                parts = uri[8:].split("/")
-                if len(parts) >= 2:
-                    session_id = parts[0]
-                    resource_type = parts[1]
+            if uri.startswith("debug://schema/"):
+                tool = uri[15:]
+                schema = self._tool_schemas.get(tool)
+                if schema is None:
+                    return _dump({"error": f"Unknown tool schema: {tool}"})
+                return schema
 
-                    try:
-                        session = await self.session_manager.get_session(session_id)
-                    except SessionNotFoundError:
-                        return json.dumps({"error": f"Session not found: {session_id}"})
+            # Parse session-specific URIs: debug://<session_id>/<resource_type>
+            if uri.startswith("debug://"):
+                session_id, _, tail = uri[8:].partition("/")
+                resource_type = tail.partition("/")[0]
+                if session_id and resource_type:
+                    session = self.session_manager.get_session_nowait(session_id)
+                    if session is None:
+                        return _dump({"error": f"Session not found: {session_id}"})
 
                     if resource_type == "state":
-                        return json.dumps(session.get_info().model_dump(), indent=2)
+                        return _dump(session.get_info().model_dump())
                     elif resource_type == "threads":
-                        threads = await session.get_threads()
-                        return json.dumps([t.model_dump() for t in threads], indent=2)
+                        return await self._read_threads(session)
                     elif resource_type == "breakpoints":
-                        return json.dumps(
+                        return _dump(
                             {
-                                path: [bp.model_dump() for bp in bps]
+                                path: _DUMP_BREAKPOINTS(bps)
                                 for path, bps in session.breakpoints.items()
-                            },
-                            indent=2,
+                            }
                         )
 
-            return json.dumps({"error": f"Unknown resource: {uri}"})
+            return _dump({"error": f"Unknown resource: {uri}"})
+
+    async def _read_threads(self, session: DebugSession) -> str:
+        """Read the threads resource, reusing the last payload if threads are unchanged."""
+        generation = session.threads_generation
+        cached = self._threads_json_cache.get(session.session_id)
+        if cached is not None and cached[0] == generation:
+            return cached[1]
+
+        threads = await session.get_threads()
+        payload = _dump(_DUMP_THREADS(threads))
+        # Keyed by the generation seen before the request, so an event that
+        # lands mid-request invalidates this entry
+        self._threads_json_cache[session.session_id] = (generation, payload)
+        return payload
 
     def _on_debug_event(self, session_id: str, event: DAPEvent) -> None:
         """Handle debug events for logging/notifications."""
@@ -535,7 +769,20 @@ async def serve() -> None:
 
 
 def main() -> None:
-    """Entry point for mcp-dap command."""
+    """Entry point for mcp-dap command.
+
+    Runs on uvloop when the optional ``uvloop`` extra is installed and
+    ``use_uvloop`` is enabled, and on the default asyncio event loop otherwise.
+    """
+    if get_config().use_uvloop:
+        try:
+            import uvloop
+        except ImportError:
+            pass
+        else:
+            uvloop.run(serve())
+            return
+
     asyncio.run(serve())
 
 
@@ -3,11 +3,13 @@
 from __future__ import annotations
 
 import asyncio
-import contextlib
 import uuid
+from collections import deque
+from types import MappingProxyType
 from typing import TYPE_CHECKING
 from typing import Any
 
+from mcp_dap.adapters.codelldb import CodeLLDBAdapter
 from mcp_dap.dap.client import DAPClient
 from mcp_dap.exceptions import AdapterNotFoundError
 from mcp_dap.exceptions import MCPDAPError
@@ -19,6 +21,7 @@ from mcp_dap.types import OutputEvent
 from mcp_dap.types import Scope
 from mcp_dap.types import SessionInfo
 from mcp_dap.types import SessionState
+from mcp_dap.types import Source
 from mcp_dap.types import StackFrame
 from mcp_dap.types import StoppedEvent
 from mcp_dap.types import StopReason
@@ -27,6 +30,7 @@ from mcp_dap.types import Variable
 
 if TYPE_CHECKING:
     from collections.abc import Callable
+    from collections.abc import Mapping
     from pathlib import Path
 
     from mcp_dap.adapters.base import AdapterConfig
@@ -34,9 +38,37 @@ if TYPE_CHECKING:
     from mcp_dap.dap.messages import DAPEvent
 
 
+# DAP stop reason string -> StopReason, avoiding a ValueError per unknown reason
+_STOP_REASON_MAP: dict[str, StopReason] = {reason.value: reason for reason in StopReason}
+
+# Largest output string built by merging consecutive plain output events
+_OUTPUT_COALESCE_LIMIT = 64 * 1024
+
+
 class DebugSession:
     """A debug session with a single debug adapter."""
 
+    __slots__ = (
+        "_breakpoints",
+        "_event_callbacks",
+        "_event_handlers",
+        "_info",
+        "_output_buffer",
+        "_pending_events",
+        "_program",
+        "_resume_lock",
+        "_state",
+        "_stop_future",
+        "_stop_reason",
+        "_stop_signaled",
+        "_stopped_thread_id",
+        "_threads",
+        "_threads_generation",
+        "adapter",
+        "client",
+        "session_id",
+    )
+
     def __init__(
         self,
         session_id: str,
@@ -57,13 +89,21 @@ class DebugSession:
         self._state = SessionState.INITIALIZING
         self._program: str | None = None
         self._threads: list[Thread] = []
+        self._threads_generation = 0
+        # Cached get_info() result; reset whenever a field it reports changes
+        self._info: SessionInfo | None = None
         self._stopped_thread_id: int | None = None
         self._stop_reason: StopReason | None = None
 
         # Event storage
-        self._pending_events: list[DAPEvent] = []
-        self._output_buffer: list[OutputEvent] = []
-        self._stop_event: asyncio.Event = asyncio.Event()
+        self._pending_events: deque[DAPEvent] = deque()
+        self._output_buffer: deque[OutputEvent] = deque()
+        # Stop signalling for the single resume-and-wait caller: a flag for
+        # stops nobody is waiting on yet, plus the waiter's future
+        self._stop_signaled = False
+        self._stop_future: asyncio.Future[None] | None = None
+        # Serializes resume-and-wait calls; the MCP server runs requests concurrently
+        self._resume_lock = asyncio.Lock()
 
         # Breakpoints by source path
         self._breakpoints: dict[str, list[Breakpoint]] = {}
@@ -71,6 +111,15 @@ class DebugSession:
         # Event callbacks
         self._event_callbacks: list[Callable[[str, DAPEvent], Any]] = []
 
+        # DAP event name -> state handler, called with the event body
+        self._event_handlers: dict[str, Callable[[dict[str, Any]], None]] = {
+            "stopped": self._handle_stopped,
+            "continued": self._handle_continued,
+            "terminated": self._handle_terminated,
+            "output": self._handle_output,
+            "thread": self._handle_thread,
+        }
+
         # Register event handler
         self.client.add_event_handler(self._handle_event)
 
@@ -108,8 +157,6 @@ class DebugSession:
         """
         # Handle cargo build if cargo_args provided
         if cargo_args is not None:
-            from mcp_dap.adapters.codelldb import CodeLLDBAdapter
-
             if not isinstance(self.adapter, CodeLLDBAdapter):
                 raise MCPDAPError("cargo_args is only supported with CodeLLDB adapter (rust)")
 
@@ -122,11 +169,13 @@ class DebugSession:
                 **kwargs,
             )
             self._program = launch_args.get("program")
+            self._info = None
         else:
             if program is None:
                 raise MCPDAPError("Either 'program' or 'cargo_args' must be provided")
 
             self._program = program
+            self._info = None
             launch_args = self.adapter.get_launch_arguments(
                 program=program,
                 args=args,
@@ -141,6 +190,7 @@ class DebugSession:
         await self.client.configuration_done()
         await self.client.complete_launch()
         self._state = SessionState.RUNNING
+        self._info = None
 
     async def attach(
         self,
@@ -168,6 +218,7 @@ class DebugSession:
         await self.client.configuration_done()
         await self.client.complete_launch()  # Also works for attach
         self._state = SessionState.RUNNING
+        self._info = None
 
     async def disconnect(self, terminate: bool = True) -> None:
         """Disconnect from the debug session.
@@ -176,6 +227,7 @@ class DebugSession:
             terminate: Whether to terminate the debuggee
         """
         self._state = SessionState.TERMINATED
+        self._info = None
         await self.client.disconnect_debuggee(terminate=terminate)
         await self.client.disconnect()
 
@@ -196,19 +248,22 @@ class DebugSession:
         result = await self.client.set_breakpoints(source_path, breakpoints)
 
         # Store and convert to our types
-        bps = [
-            Breakpoint(
-                id=bp.get("id"),
-                verified=bp.get("verified", False),
-                message=bp.get("message"),
-                source_path=source_path,
-                line=bp.get("line"),
-                column=bp.get("column"),
-                end_line=bp.get("endLine"),
-                end_column=bp.get("endColumn"),
+        bps: list[Breakpoint] = []
+        append = bps.append
+        for bp in result:
+            get = bp.get
+            append(
+                Breakpoint(
+                    id=get("id"),
+                    verified=get("verified", False),
+                    message=get("message"),
+                    source_path=source_path,
+                    line=get("line"),
+                    column=get("column"),
+                    end_line=get("endLine"),
+                    end_column=get("endColumn"),
+                )
             )
-            for bp in result
-        ]
 
         self._breakpoints[source_path] = bps
         return bps
@@ -216,9 +271,14 @@ class DebugSession:
     async def clear_breakpoints(self, source_path: str) -> None:
         """Clear all breakpoints in a source file.
 
+        Files with no breakpoints set through this session are skipped
+        without a DAP request.
+
         Args:
             source_path: Path to source file
         """
+        if source_path not in self._breakpoints:
+            return
         await self.client.set_breakpoints(source_path, [])
         self._breakpoints.pop(source_path, None)
 
@@ -236,17 +296,14 @@ class DebugSession:
         Returns:
             StoppedEvent if wait=True and execution stopped, None otherwise
         """
-        tid = thread_id or self._stopped_thread_id or 1
-        self._stop_event.clear()
-        self._state = SessionState.RUNNING
-        self._stopped_thread_id = None
-        self._stop_reason = None
+        async with self._resume_lock:
+            tid = self._before_resume(thread_id)
 
-        await self.client.continue_execution(tid)
+            await self.client.continue_execution(tid)
 
-        if wait:
-            return await self._wait_for_stop()
-        return None
+            if wait:
+                return await self._wait_for_stop()
+            return None
 
     async def step_over(
         self,
@@ -262,15 +319,14 @@ class DebugSession:
         Returns:
             StoppedEvent if wait=True, None otherwise
         """
-        tid = thread_id or self._stopped_thread_id or 1
-        self._stop_event.clear()
-        self._state = SessionState.RUNNING
+        async with self._resume_lock:
+            tid = self._before_resume(thread_id)
 
-        await self.client.next(tid)
+            await self.client.next(tid)
 
-        if wait:
-            return await self._wait_for_stop()
-        return None
+            if wait:
+                return await self._wait_for_stop()
+            return None
 
     async def step_into(
         self,
@@ -286,15 +342,14 @@ class DebugSession:
         Returns:
             StoppedEvent if wait=True, None otherwise
         """
-        tid = thread_id or self._stopped_thread_id or 1
-        self._stop_event.clear()
-        self._state = SessionState.RUNNING
+        async with self._resume_lock:
+            tid = self._before_resume(thread_id)
 
-        await self.client.step_in(tid)
+            await self.client.step_in(tid)
 
-        if wait:
-            return await self._wait_for_stop()
-        return None
+            if wait:
+                return await self._wait_for_stop()
+            return None
 
     async def step_out(
         self,
@@ -310,15 +365,14 @@ class DebugSession:
         Returns:
             StoppedEvent if wait=True, None otherwise
         """
-        tid = thread_id or self._stopped_thread_id or 1
-        self._stop_event.clear()
-        self._state = SessionState.RUNNING
+        async with self._resume_lock:
+            tid = self._before_resume(thread_id)
 
-        await self.client.step_out(tid)
+            await self.client.step_out(tid)
 
-        if wait:
-            return await self._wait_for_stop()
-        return None
+            if wait:
+                return await self._wait_for_stop()
+            return None
 
     async def pause(self, thread_id: int | None = None) -> None:
         """Pause execution.
@@ -336,10 +390,17 @@ class DebugSession:
             List of threads
         """
         result = await self.client.threads()
-        self._threads = [
-            Thread(id=t["id"], name=t.get("name", f"Thread {t['id']}")) for t in result
-        ]
-        return self._threads
+        threads: list[Thread] = []
+        append = threads.append
+        for t in result:
+            tid = t["id"]
+            name = t.get("name")
+            append(Thread(id=tid, name=name if name is not None else f"Thread {tid}"))
+        if threads != self._threads:
+            self._threads_generation += 1
+            self._info = None
+        self._threads = threads
+        return threads
 
     async def get_stack_trace(
         self,
@@ -360,19 +421,23 @@ class DebugSession:
         tid = thread_id or self._stopped_thread_id or 1
         frames, _ = await self.client.stack_trace(tid, start_frame, levels)
 
-        return [
-            StackFrame(
-                id=f["id"],
-                name=f.get("name", ""),
-                source=f.get("source"),
-                line=f.get("line", 0),
-                column=f.get("column", 0),
-                end_line=f.get("endLine"),
-                end_column=f.get("endColumn"),
-                module_id=f.get("moduleId"),
+        stack: list[StackFrame] = []
+        append = stack.append
+        for f in frames:
+            get = f.get
+            append(
+                StackFrame(
+                    id=f["id"],
+                    name=get("name", ""),
+                    source=Source.from_dap(get("source")),
+                    line=get("line", 0),
+                    column=get("column", 0),
+                    end_line=get("endLine"),
+                    end_column=get("endColumn"),
+                    module_id=get("moduleId"),
+                )
             )
-            for f in frames
-        ]
+        return stack
 
     async def get_scopes(self, frame_id: int) -> list[Scope]:
         """Get scopes for a stack frame.
@@ -385,22 +450,26 @@ class DebugSession:
         """
         result = await self.client.scopes(frame_id)
 
-        return [
-            Scope(
-                name=s.get("name", ""),
-                presentation_hint=s.get("presentationHint"),
-                variables_reference=s["variablesReference"],
-                named_variables=s.get("namedVariables"),
-                indexed_variables=s.get("indexedVariables"),
-                expensive=s.get("expensive", False),
-                source=s.get("source"),
-                line=s.get("line"),
-                column=s.get("column"),
-                end_line=s.get("endLine"),
-                end_column=s.get("endColumn"),
+        scopes: list[Scope] = []
+        append = scopes.append
+        for s in result:
+            get = s.get
+            append(
+                Scope(
+                    name=get("name", ""),
+                    presentation_hint=get("presentationHint"),
+                    variables_reference=s["variablesReference"],
+                    named_variables=get("namedVariables"),
+                    indexed_variables=get("indexedVariables"),
+                    expensive=get("expensive", False),
+                    source=Source.from_dap(get("source")),
+                    line=get("line"),
+                    column=get("column"),
+                    end_line=get("endLine"),
+                    end_column=get("endColumn"),
+                )
             )
-            for s in result
-        ]
+        return scopes
 
     async def get_variables(
         self,
@@ -418,19 +487,23 @@ class DebugSession:
         """
         result = await self.client.variables(variables_reference, filter_type)
 
-        return [
-            Variable(
-                name=v.get("name", ""),
-                value=v.get("value", ""),
-                type=v.get("type"),
-                presentation_hint=v.get("presentationHint"),
-                evaluate_name=v.get("evaluateName"),
-                variables_reference=v.get("variablesReference", 0),
-                named_variables=v.get("namedVariables"),
-                indexed_variables=v.get("indexedVariables"),
+        variables: list[Variable] = []
+        append = variables.append
+        for v in result:
+            get = v.get
+            append(
+                Variable(
+                    name=get("name", ""),
+                    value=get("value", ""),
+                    type=get("type"),
+                    presentation_hint=get("presentationHint"),
+                    evaluate_name=get("evaluateName"),
+                    variables_reference=get("variablesReference", 0),
+                    named_variables=get("namedVariables"),
+                    indexed_variables=get("indexedVariables"),
+                )
             )
-            for v in result
-        ]
+        return variables
 
     async def evaluate(
         self,
@@ -459,15 +532,27 @@ class DebugSession:
             indexed_variables=result.get("indexedVariables"),
         )
 
-    def get_pending_events(self) -> list[DAPEvent]:
-        """Get and clear pending events.
+    @property
+    def has_pending_events(self) -> bool:
+        """Whether events are waiting to be collected."""
+        return bool(self._pending_events)
+
+    def get_pending_events(self, max_batch: int = 256) -> list[DAPEvent]:
+        """Get and remove up to max_batch pending events, oldest first.
+
+        Args:
+            max_batch: Maximum number of events to return
 
         Returns:
             List of pending events
         """
-        events = self._pending_events[:]
-        self._pending_events.clear()
-        return events
+        pending = self._pending_events
+        if len(pending) <= max_batch:
+            self._pending_events = deque()
+            return list(pending)
+
+        popleft = pending.popleft
+        return [popleft() for _ in range(max_batch)]
 
     def get_output(self) -> list[OutputEvent]:
         """Get and clear output buffer.
@@ -475,25 +560,31 @@ class DebugSession:
         Returns:
             List of output events
         """
-        output = self._output_buffer[:]
-        self._output_buffer.clear()
-        return output
+        output = self._output_buffer
+        self._output_buffer = deque()
+        return list(output)
 
     def get_info(self) -> SessionInfo:
         """Get session information.
 
+        The object is cached until the session state, program, threads or
+        stop details change, so callers must not mutate it.
+
         Returns:
             Session info object
         """
-        return SessionInfo(
-            session_id=self.session_id,
-            adapter=self.adapter.name,
-            state=self._state,
-            program=self._program,
-            threads=self._threads,
-            stopped_thread_id=self._stopped_thread_id,
-            stop_reason=self._stop_reason,
-        )
+        info = self._info
+        if info is None:
+            info = self._info = SessionInfo(
+                session_id=self.session_id,
+                adapter=self.adapter.name,
+                state=self._state,
+                program=self._program,
+                threads=tuple(self._threads),
+                stopped_thread_id=self._stopped_thread_id,
+                stop_reason=self._stop_reason,
+            )
+        return info
 
     def add_event_callback(
         self,
@@ -515,10 +606,14 @@ class DebugSession:
         Returns:
             StoppedEvent when stopped, None on timeout
         """
-        try:
-            await asyncio.wait_for(self._stop_event.wait(), timeout)
-        except TimeoutError:
-            return None
+        if not self._stop_signaled:
+            future = self._stop_future
+            if future is None or future.done():
+                future = self._stop_future = asyncio.get_running_loop().create_future()
+            # asyncio.wait leaves the future pending on timeout, unlike wait_for
+            done, _ = await asyncio.wait((future,), timeout=timeout)
+            if not done:
+                return None
 
         if self._stopped_thread_id and self._stop_reason:
             return StoppedEvent(
@@ -531,82 +626,145 @@ class DebugSession:
         """Handle DAP events."""
         self._pending_events.append(event)
 
-        if event.event == "stopped":
-            self._handle_stopped(event)
-        elif event.event == "continued":
-            self._handle_continued(event)
-        elif event.event == "terminated":
-            self._handle_terminated(event)
-        elif event.event == "output":
-            self._handle_output(event)
-        elif event.event == "thread":
-            self._handle_thread(event)
-
-        # Notify callbacks
-        for callback in self._event_callbacks:
-            with contextlib.suppress(Exception):
-                callback(self.session_id, event)
-
-    def _handle_stopped(self, event: DAPEvent) -> None:
+        handler = self._event_handlers.get(event.event)
+        if handler is not None:
+            handler(event.body or {})
+
+        # Notify callbacks; try/except avoids a suppress() object per call
+        callbacks = self._event_callbacks
+        if not callbacks:
+            return
+        session_id = self.session_id
+        for callback in callbacks:
+            try:  # noqa: SIM105
+                callback(session_id, event)
+            except Exception:
+                pass
+
+    def _handle_stopped(self, body: dict[str, Any]) -> None:
         """Handle stopped event."""
-        body = event.body or {}
         self._state = SessionState.STOPPED
         self._stopped_thread_id = body.get("threadId")
+        self._threads_generation += 1
 
-        reason_str = body.get("reason", "unknown")
-        try:
-            self._stop_reason = StopReason(reason_str)
-        except ValueError:
-            self._stop_reason = StopReason.BREAKPOINT  # Default
+        # Unrecognized reasons default to breakpoint
+        self._stop_reason = _STOP_REASON_MAP.get(body.get("reason", ""), StopReason.BREAKPOINT)
+        self._info = None
 
-        self._stop_event.set()
+        self._signal_stop()
 
-    def _handle_continued(self, _event: DAPEvent) -> None:
+    def _handle_continued(self, _body: dict[str, Any]) -> None:
         """Handle continued event."""
+        self._transition_to_running()
+
+    def _before_resume(self, thread_id: int | None) -> int:
+        """Pick the thread to resume and mark the session running.
+
+        Args:
+            thread_id: Requested thread, if any
+
+        Returns:
+            The requested thread, else the last stopped thread, else 1
+        """
+        tid = thread_id or self._stopped_thread_id or 1
+        self._transition_to_running()
+        return tid
+
+    def _transition_to_running(self) -> None:
+        """Mark the debuggee running and forget the previous stop."""
         self._state = SessionState.RUNNING
         self._stopped_thread_id = None
         self._stop_reason = None
-        self._stop_event.clear()
-
-    def _handle_terminated(self, _event: DAPEvent) -> None:
+        self._info = None
+        # A pending future keeps its waiter; it resolves on the next stop
+        self._stop_signaled = False
+
+    def _signal_stop(self) -> None:
+        """Wake the caller waiting for execution to stop, if any."""
+        self._stop_signaled = True
+        future = self._stop_future
+        if future is not None and not future.done():
+            future.set_result(None)
+
+    def _handle_terminated(self, _body: dict[str, Any]) -> None:
         """Handle terminated event."""
         self._state = SessionState.TERMINATED
-        self._stop_event.set()
+        self._info = None
+        self._threads_generation += 1
+        self._signal_stop()
 
-    def _handle_output(self, event: DAPEvent) -> None:
-        """Handle output event."""
-        body = event.body or {}
-        self._output_buffer.append(
+    def _handle_output(self, body: dict[str, Any]) -> None:
+        """Handle output event.
+
+        Plain text output (no group, source location or variables) is
+        appended to the newest buffered event of the same category, up to
+        _OUTPUT_COALESCE_LIMIT characters, so stdout floods do not buffer
+        one event per write.
+        """
+        get = body.get
+        category = get("category", "console")
+        output = get("output", "")
+        buffer = self._output_buffer
+
+        plain = not (
+            get("group")
+            or get("variablesReference")
+            or get("source")
+            or get("line") is not None
+        )
+        if plain and buffer:
+            last = buffer[-1]
+            if (
+                last.category == category
+                and last.group is None
+                and not last.variables_reference
+                and last.source is None
+                and last.line is None
+                and len(last.output) + len(output) <= _OUTPUT_COALESCE_LIMIT
+            ):
+                last.output += output
+                return
+
+        buffer.append(
             OutputEvent(
-                category=body.get("category", "console"),
-                output=body.get("output", ""),
-                group=body.get("group"),
-                variables_reference=body.get("variablesReference"),
-                source=body.get("source"),
-                line=body.get("line"),
-                column=body.get("column"),
+                category=category,
+                output=output,
+                group=get("group"),
+                variables_reference=get("variablesReference"),
+                source=Source.from_dap(get("source")),
+                line=get("line"),
+                column=get("column"),
             )
         )
 
-    def _handle_thread(self, event: DAPEvent) -> None:
+    def _handle_thread(self, _body: dict[str, Any]) -> None:
         """Handle thread event."""
         # Thread started/exited - we'll refresh on next get_threads call
-        pass
+        self._threads_generation += 1
 
     @property
     def state(self) -> SessionState:
         """Current session state."""
         return self._state
 
+    @property
+    def threads_generation(self) -> int:
+        """Counter bumped whenever the thread list may have changed.
+
+        Incremented on thread, stopped and terminated events and when
+        get_threads() returns a different list than the previous call.
+        """
+        return self._threads_generation
+
     @property
     def stopped_thread_id(self) -> int | None:
         """ID of the stopped thread, if any."""
         return self._stopped_thread_id
 
     @property
-    def breakpoints(self) -> dict[str, list[Breakpoint]]:
-        """All breakpoints by source path."""
-        return self._breakpoints.copy()
+    def breakpoints(self) -> Mapping[str, list[Breakpoint]]:
+        """All breakpoints by source path, as a read-only live view."""
+        return MappingProxyType(self._breakpoints)
 
 
 class SessionManager:
@@ -724,6 +882,17 @@ class SessionManager:
             raise SessionNotFoundError(f"Session not found: {session_id}")
         return session
 
+    def get_session_nowait(self, session_id: str) -> DebugSession | None:
+        """Get an existing session without awaiting.
+
+        Args:
+            session_id: Session ID
+
+        Returns:
+            The debug session, or None if not found
+        """
+        return self._sessions.get(session_id)
+
     async def close_session(self, session_id: str, terminate: bool = True) -> None:
         """Close a debug session.
 
@@ -736,9 +905,18 @@ class SessionManager:
             await session.disconnect(terminate=terminate)
 
     async def close_all(self) -> None:
-        """Close all debug sessions."""
-        for session_id in list(self._sessions.keys()):
-            await self.close_session(session_id)
+        """Close all debug sessions concurrently.
+
+        Every session is closed even if some disconnects fail; the first
+        failure is re-raised once all of them have finished.
+        """
+        results = await asyncio.gather(
+            *[self.close_session(session_id) for session_id in list(self._sessions)],
+            return_exceptions=True,
+        )
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
 
     def list_sessions(self) -> list[SessionInfo]:
         """List all active sessions.
@@ -748,6 +926,25 @@ class SessionManager:
         """
         return [session.get_info() for session in self._sessions.values()]
 
+    def list_session_ids(self) -> list[str]:
+        """List the IDs of all active sessions.
+
+        Returns:
+            List of session IDs
+        """
+        return list(self._sessions)
+
+    def list_session_states(self) -> list[tuple[str, SessionState]]:
+        """List the ID and state of all active sessions.
+
+        A lighter alternative to list_sessions() for pollers that only
+        need to know which sessions exist and whether they are stopped.
+
+        Returns:
+            List of (session ID, state) pairs
+        """
+        return [(sid, session.state) for sid, session in self._sessions.items()]
+
     def add_event_callback(
         self,
         callback: Callable[[str, DAPEvent], Any],
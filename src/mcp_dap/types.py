@@ -1,7 +1,13 @@
-"""Pydantic models for mcp-dap."""
+"""Data types for mcp-dap.
+
+Types built once per adapter result row (breakpoints, frames, scopes,
+variables, events) are slotted dataclasses so construction skips
+validation; boundary and configuration types remain Pydantic models.
+"""
 
 from __future__ import annotations
 
+from dataclasses import dataclass
 from enum import StrEnum
 from typing import Any
 
@@ -46,7 +52,8 @@ class SourceBreakpoint(BaseModel):
     log_message: str | None = None
 
 
-class Breakpoint(BaseModel):
+@dataclass(slots=True, kw_only=True)
+class Breakpoint:
     """A verified breakpoint returned by the adapter."""
 
     id: int | None = None
@@ -69,15 +76,35 @@ class Thread(BaseModel):
     name: str
 
 
-class Source(BaseModel):
+@dataclass(slots=True, kw_only=True)
+class Source:
     """Source file information."""
 
     name: str | None = None
     path: str | None = None
     source_reference: int | None = None
 
+    @classmethod
+    def from_dap(cls, source: dict[str, Any] | None) -> Source | None:
+        """Build from a DAP ``Source`` object.
+
+        Args:
+            source: The DAP source dict, if any
+
+        Returns:
+            The source, or None if none was given
+        """
+        if source is None:
+            return None
+        return cls(
+            name=source.get("name"),
+            path=source.get("path"),
+            source_reference=source.get("sourceReference"),
+        )
+
 
-class StackFrame(BaseModel):
+@dataclass(slots=True, kw_only=True)
+class StackFrame:
     """A stack frame."""
 
     id: int
@@ -93,7 +120,8 @@ class StackFrame(BaseModel):
 # === Variables and Scopes ===
 
 
-class Scope(BaseModel):
+@dataclass(slots=True, kw_only=True)
+class Scope:
     """A scope containing variables."""
 
     name: str
@@ -109,7 +137,8 @@ class Scope(BaseModel):
     end_column: int | None = None
 
 
-class Variable(BaseModel):
+@dataclass(slots=True, kw_only=True)
+class Variable:
     """A variable."""
 
     name: str
@@ -125,7 +154,8 @@ class Variable(BaseModel):
 # === Events ===
 
 
-class StoppedEvent(BaseModel):
+@dataclass(slots=True, kw_only=True)
+class StoppedEvent:
     """Event when execution stops."""
 
     reason: StopReason
@@ -134,10 +164,11 @@ class StoppedEvent(BaseModel):
     preserve_focus_hint: bool = False
     text: str | None = None
     all_threads_stopped: bool = False
-    hit_breakpoint_ids: list[int] = Field(default_factory=list)
+    hit_breakpoint_ids: tuple[int, ...] = ()
 
 
-class OutputEvent(BaseModel):
+@dataclass(slots=True, kw_only=True)
+class OutputEvent:
     """Event for debuggee output."""
 
     category: str = "console"  # console, stdout, stderr, telemetry
@@ -186,7 +217,7 @@ class SessionInfo(BaseModel):
     adapter: str
     state: SessionState
     program: str | None = None
-    threads: list[Thread] = Field(default_factory=list)
+    threads: tuple[Thread, ...] = ()
     stopped_thread_id: int | None = None
     stop_reason: StopReason | None = None
 
@@ -2,8 +2,29 @@
 
 from __future__ import annotations
 
+import os
+import sys
+from typing import TYPE_CHECKING
+
 import pytest
 
+from mcp_dap.adapters.base import get_adapter_aliases
+from mcp_dap.adapters.base import get_registered_adapters
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+    from mcp_dap.adapters.base import AdapterConfig
+
+
+def pytest_configure() -> None:
+    """Skip writing .pyc files on CI, where they are never reused.
+
+    Local runs keep writing bytecode; assertion rewriting stays enabled.
+    """
+    if os.environ.get("CI"):
+        sys.dont_write_bytecode = True
+
 
 @pytest.fixture
 def sample_breakpoints() -> list[dict[str, int]]:
@@ -13,3 +34,21 @@ def sample_breakpoints() -> list[dict[str, int]]:
         {"line": 20},
         {"line": 30, "condition": "x > 5"},
     ]
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _preload_adapters() -> None:
+    """Import and register every built-in adapter once per test session."""
+    import mcp_dap.adapters  # noqa: F401
+
+
+@pytest.fixture(scope="session")
+def registry(_preload_adapters: None) -> Mapping[str, type[AdapterConfig]]:
+    """Read-only view of the registered adapter classes."""
+    return get_registered_adapters()
+
+
+@pytest.fixture(scope="session")
+def aliases(_preload_adapters: None) -> Mapping[str, str]:
+    """Read-only view of the registered adapter aliases."""
+    return get_adapter_aliases()
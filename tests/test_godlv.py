@@ -2,38 +2,58 @@
 
 from __future__ import annotations
 
-import os
-import tempfile
 from pathlib import Path
+from typing import TYPE_CHECKING
+from typing import Any
 from unittest import mock
 
 import pytest
 
-from mcp_dap.adapters.base import get_adapter_aliases
-from mcp_dap.adapters.base import get_registered_adapters
 from mcp_dap.adapters.godlv import DelveAdapter
 from mcp_dap.adapters.godlv import DelveAttachConfig
 from mcp_dap.adapters.godlv import DelveLaunchConfig
+from mcp_dap.config import ServerConfig
 from mcp_dap.dap.transport import SubprocessSocketTransport
 from mcp_dap.exceptions import AdapterNotFoundError
 from mcp_dap.exceptions import MCPDAPError
 
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+    from mcp_dap.adapters.base import AdapterConfig
+
+
+@pytest.fixture(scope="class")
+def adapter() -> DelveAdapter:
+    """Shared adapter for tests that do not patch or mutate it."""
+    return DelveAdapter()
+
+
+@pytest.fixture(scope="module")
+def launch_schema() -> dict[str, Any]:
+    """JSON schema for DelveLaunchConfig, generated once per module."""
+    return DelveLaunchConfig.cached_json_schema()
+
 
 class TestDelveRegistration:
     """Tests for adapter registration via @adapter decorator."""
 
-    def test_registered_in_global_registry(self) -> None:
+    def test_registered_in_global_registry(
+        self, registry: Mapping[str, type[AdapterConfig]]
+    ) -> None:
         """Test that godlv is registered in the adapter registry."""
-        registry = get_registered_adapters()
         assert "godlv" in registry
         assert registry["godlv"] is DelveAdapter
 
-    def test_aliases_registered(self) -> None:
+    def test_aliases_registered(self, aliases: Mapping[str, str]) -> None:
         """Test that all aliases are registered."""
-        aliases = get_adapter_aliases()
-        for alias in ["go", "delve", "dlv"]:
-            assert alias in aliases
-            assert aliases[alias] == "godlv"
+        expected = dict.fromkeys(("go", "delve", "dlv"), "godlv")
+        assert expected.items() <= aliases.items()
+
+    def test_registry_is_read_only(self, registry: Mapping[str, type[AdapterConfig]]) -> None:
+        """Test that the registry view cannot be modified by callers."""
+        with pytest.raises(TypeError):
+            registry["godlv"] = DelveAdapter  # type: ignore[index]
 
     def test_adapter_metadata(self) -> None:
         """Test adapter class metadata set by decorator."""
@@ -41,9 +61,8 @@ class TestDelveRegistration:
         assert DelveAdapter.adapter_id == "go"
         assert ".go" in DelveAdapter.file_extensions
 
-    def test_adapter_description(self) -> None:
+    def test_adapter_description(self, adapter: DelveAdapter) -> None:
         """Test adapter description from class docstring."""
-        adapter = DelveAdapter()
         desc = adapter.description
         assert "Go" in desc or "Delve" in desc
 
@@ -98,16 +117,20 @@ class TestDelveLaunchConfig:
         )
         assert config.mode == "exec"
 
-    def test_schema_has_expected_fields(self) -> None:
+    def test_schema_has_expected_fields(self, launch_schema: dict[str, Any]) -> None:
         """Test JSON schema includes all expected properties."""
-        schema = DelveLaunchConfig.model_json_schema()
-        props = schema["properties"]
+        props = launch_schema["properties"]
         assert "program" in props
         assert "mode" in props
         assert "build_flags" in props
         assert "dlv_flags" in props
         assert "show_global_variables" in props
 
+    def test_cached_schema_is_reused(self, launch_schema: dict[str, Any]) -> None:
+        """Test that the schema is generated once and matches Pydantic's output."""
+        assert DelveLaunchConfig.cached_json_schema() is launch_schema
+        assert launch_schema == DelveLaunchConfig.model_json_schema()
+
 
 class TestDelveAttachConfig:
     """Tests for DelveAttachConfig Pydantic model."""
@@ -144,14 +167,12 @@ class TestDelveAttachConfig:
 class TestDelveAdapter:
     """Tests for DelveAdapter class."""
 
-    def test_launch_config_class(self) -> None:
+    def test_launch_config_class(self, adapter: DelveAdapter) -> None:
         """Test that launch_config_class returns DelveLaunchConfig."""
-        adapter = DelveAdapter()
         assert adapter.launch_config_class is DelveLaunchConfig
 
-    def test_attach_config_class(self) -> None:
+    def test_attach_config_class(self, adapter: DelveAdapter) -> None:
         """Test that attach_config_class returns DelveAttachConfig."""
-        adapter = DelveAdapter()
         assert adapter.attach_config_class is DelveAttachConfig
 
     def test_from_config_default(self) -> None:
@@ -169,17 +190,13 @@ class TestDelveAdapter:
 class TestDelveFindDlv:
     """Tests for dlv binary discovery."""
 
-    def test_find_dlv_explicit_path(self) -> None:
+    def test_find_dlv_explicit_path(self, tmp_path: Path) -> None:
         """Test finding dlv with explicit path."""
-        with tempfile.NamedTemporaryFile(suffix="dlv", delete=False) as f:
-            f.write(b"#!/bin/sh\n")
-            dlv_path = f.name
+        dlv_path = tmp_path / "dlv"
+        dlv_path.touch()
 
-        try:
-            adapter = DelveAdapter(dlv_path=dlv_path)
-            assert adapter.find_dlv() == dlv_path
-        finally:
-            Path(dlv_path).unlink()
+        adapter = DelveAdapter(dlv_path=str(dlv_path))
+        assert adapter.find_dlv() == str(dlv_path)
 
     def test_find_dlv_explicit_path_not_found(self) -> None:
         """Test error when explicit dlv path doesn't exist."""
@@ -196,15 +213,14 @@ class TestDelveFindDlv:
         ):
             assert adapter.find_dlv() == "/usr/local/bin/dlv"
 
-    def test_find_dlv_in_gobin(self) -> None:
+    def test_find_dlv_in_gobin(self, tmp_path: Path) -> None:
         """Test finding dlv in GOBIN directory."""
-        with tempfile.TemporaryDirectory() as gobin:
-            dlv_path = Path(gobin) / "dlv"
-            dlv_path.touch()
+        dlv_path = tmp_path / "dlv"
+        dlv_path.touch()
 
-            adapter = DelveAdapter()
-            with mock.patch.object(adapter, "_find_gobin", return_value=gobin):
-                assert adapter.find_dlv() == str(dlv_path)
+        adapter = DelveAdapter()
+        with mock.patch.object(adapter, "_find_gobin", return_value=str(tmp_path)):
+            assert adapter.find_dlv() == str(dlv_path)
 
     def test_find_dlv_not_found(self) -> None:
         """Test error when dlv is not found anywhere."""
@@ -220,37 +236,31 @@ class TestDelveFindDlv:
 class TestDelveGobin:
     """Tests for GOBIN/GOPATH discovery."""
 
-    def test_find_gobin_from_env(self) -> None:
+    def test_find_gobin_from_env(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         """Test finding GOBIN from environment variable."""
-        with (
-            tempfile.TemporaryDirectory() as gobin,
-            mock.patch.dict(os.environ, {"GOBIN": gobin}, clear=False),
-        ):
-            result = DelveAdapter._find_gobin()
-            assert result == gobin
+        monkeypatch.setenv("GOBIN", str(tmp_path))
 
-    def test_find_gobin_from_gopath(self) -> None:
+        assert DelveAdapter._find_gobin() == str(tmp_path)
+
+    def test_find_gobin_from_gopath(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         """Test finding Go bin from GOPATH."""
-        with tempfile.TemporaryDirectory() as gopath:
-            bin_dir = Path(gopath) / "bin"
-            bin_dir.mkdir()
-            with mock.patch.dict(
-                os.environ, {"GOPATH": gopath}, clear=False
-            ):
-                # Clear GOBIN to test GOPATH fallback
-                env = os.environ.copy()
-                env.pop("GOBIN", None)
-                env["GOPATH"] = gopath
-                with mock.patch.dict(os.environ, env, clear=True):
-                    result = DelveAdapter._find_gobin()
-                    assert result == str(bin_dir)
-
-    def test_find_gobin_not_found(self) -> None:
+        bin_dir = tmp_path / "bin"
+        bin_dir.mkdir()
+        # Clear GOBIN to test GOPATH fallback
+        monkeypatch.delenv("GOBIN", raising=False)
+        monkeypatch.setenv("GOPATH", str(tmp_path))
+
+        assert DelveAdapter._find_gobin() == str(bin_dir)
+
+    def test_find_gobin_not_found(self, monkeypatch: pytest.MonkeyPatch) -> None:
         """Test when Go bin directory is not found."""
-        with (
-            mock.patch.dict(os.environ, {}, clear=True),
-            mock.patch("pathlib.Path.home", return_value=Path("/nonexistent")),
-        ):
+        monkeypatch.delenv("GOBIN", raising=False)
+        monkeypatch.delenv("GOPATH", raising=False)
+        with mock.patch("pathlib.Path.home", return_value=Path("/nonexistent")):
             result = DelveAdapter._find_gobin()
             assert result is None
 
@@ -258,9 +268,8 @@ class TestDelveGobin:
 class TestDelveLaunchArguments:
     """Tests for get_launch_arguments method."""
 
-    def test_basic_debug_launch(self) -> None:
+    def test_basic_debug_launch(self, adapter: DelveAdapter) -> None:
         """Test basic debug mode launch arguments."""
-        adapter = DelveAdapter()
         args = adapter.get_launch_arguments(
             program="/app/cmd/server",
         )
@@ -271,9 +280,8 @@ class TestDelveLaunchArguments:
         assert args["args"] == []
         assert args["stopOnEntry"] is False
 
-    def test_test_mode_launch(self) -> None:
+    def test_test_mode_launch(self, adapter: DelveAdapter) -> None:
         """Test test mode launch arguments."""
-        adapter = DelveAdapter()
         args = adapter.get_launch_arguments(
             program="/app/pkg/handler",
             mode="test",
@@ -283,9 +291,8 @@ class TestDelveLaunchArguments:
         assert args["mode"] == "test"
         assert args["buildFlags"] == "-run TestHandler"
 
-    def test_exec_mode_launch(self) -> None:
+    def test_exec_mode_launch(self, adapter: DelveAdapter) -> None:
         """Test exec mode launch arguments."""
-        adapter = DelveAdapter()
         args = adapter.get_launch_arguments(
             program="/app/bin/server",
             args=["--port", "8080"],
@@ -302,9 +309,8 @@ class TestDelveLaunchArguments:
         assert args["env"] == {"GO_ENV": "prod"}
         assert args["stopOnEntry"] is True
 
-    def test_launch_with_substitute_path(self) -> None:
+    def test_launch_with_substitute_path(self, adapter: DelveAdapter) -> None:
         """Test launch with source path substitution."""
-        adapter = DelveAdapter()
         sub_path = [{"from": "/build", "to": "/local"}]
         args = adapter.get_launch_arguments(
             program="/app",
@@ -312,9 +318,8 @@ class TestDelveLaunchArguments:
         )
         assert args["substitutePath"] == sub_path
 
-    def test_launch_passthrough_kwargs(self) -> None:
+    def test_launch_passthrough_kwargs(self, adapter: DelveAdapter) -> None:
         """Test that unknown kwargs are passed through."""
-        adapter = DelveAdapter()
         args = adapter.get_launch_arguments(
             program="/app",
             stackTraceDepth=50,
@@ -325,9 +330,8 @@ class TestDelveLaunchArguments:
 class TestDelveAttachArguments:
     """Tests for get_attach_arguments method."""
 
-    def test_local_attach_by_pid(self) -> None:
+    def test_local_attach_by_pid(self, adapter: DelveAdapter) -> None:
         """Test local attach with process ID."""
-        adapter = DelveAdapter()
         args = adapter.get_attach_arguments(
             host="127.0.0.1",
             port=0,
@@ -339,9 +343,8 @@ class TestDelveAttachArguments:
         assert args["mode"] == "local"
         assert args["processId"] == 12345
 
-    def test_local_attach_by_pid_kwarg(self) -> None:
+    def test_local_attach_by_pid_kwarg(self, adapter: DelveAdapter) -> None:
         """Test local attach using 'pid' kwarg (alias for process_id)."""
-        adapter = DelveAdapter()
         args = adapter.get_attach_arguments(
             host="127.0.0.1",
             port=0,
@@ -350,9 +353,8 @@ class TestDelveAttachArguments:
         )
         assert args["processId"] == 12345
 
-    def test_local_attach_missing_pid_raises(self) -> None:
+    def test_local_attach_missing_pid_raises(self, adapter: DelveAdapter) -> None:
         """Test error when local attach is missing PID."""
-        adapter = DelveAdapter()
         with pytest.raises(MCPDAPError, match="process_id"):
             adapter.get_attach_arguments(
                 host="127.0.0.1",
@@ -360,9 +362,8 @@ class TestDelveAttachArguments:
                 mode="local",
             )
 
-    def test_remote_attach(self) -> None:
+    def test_remote_attach(self, adapter: DelveAdapter) -> None:
         """Test remote attach to headless Delve."""
-        adapter = DelveAdapter()
         args = adapter.get_attach_arguments(
             host="192.168.1.10",
             port=2345,
@@ -391,9 +392,8 @@ class TestDelveTransport:
 class TestDelveGetInfo:
     """Tests for get_info method."""
 
-    def test_info_structure(self) -> None:
+    def test_info_structure(self, adapter: DelveAdapter) -> None:
         """Test that get_info returns expected structure."""
-        adapter = DelveAdapter()
         info = adapter.get_info()
 
         assert info["name"] == "godlv"
@@ -422,32 +422,17 @@ class TestDelveInConfigSystem:
 
     def test_godlv_in_default_registry(self) -> None:
         """Test that godlv appears in default adapter registry."""
-        from mcp_dap.config import ServerConfig
-        from mcp_dap.config import reset_config
-
-        reset_config()
         config = ServerConfig()
         registry = config.build_adapter_registry()
 
-        assert "godlv" in registry
-        assert "go" in registry
-        assert "delve" in registry
-        assert "dlv" in registry
-        reset_config()
+        assert {"godlv", "go", "delve", "dlv"} <= registry.keys()
 
-    def test_godlv_can_be_disabled(self) -> None:
+    def test_godlv_can_be_disabled(self, monkeypatch: pytest.MonkeyPatch) -> None:
         """Test that godlv can be disabled via env var."""
-        from mcp_dap.config import ServerConfig
-        from mcp_dap.config import reset_config
-
-        reset_config()
-        with mock.patch.dict(
-            os.environ, {"MCP_DAP_ADAPTERS__GODLV__ENABLED": "false"}
-        ):
-            config = ServerConfig()
-            registry = config.build_adapter_registry()
+        monkeypatch.setenv("MCP_DAP_ADAPTERS__GODLV__ENABLED", "false")
+        config = ServerConfig()
+        registry = config.build_adapter_registry()
 
-            assert "godlv" not in registry
-            assert "go" not in registry
-            assert "delve" not in registry
-        reset_config()
+        assert "godlv" not in registry
+        assert "go" not in registry
+        assert "delve" not in registry
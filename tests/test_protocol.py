@@ -10,6 +10,12 @@ from mcp_dap.dap.protocol import parse_content_length
 from mcp_dap.exceptions import DAPProtocolError
 
 
+def _split(encoded: bytes) -> tuple[bytes, bytes]:
+    """Split an encoded message into its header and content."""
+    header, _, content = encoded.partition(b"\r\n\r\n")
+    return header, content
+
+
 class TestEncode:
     """Tests for message encoding."""
 
@@ -18,9 +24,11 @@ class TestEncode:
         data = {"seq": 1, "type": "request", "command": "initialize"}
         encoded = encode_message(data)
 
-        assert encoded.startswith(b"Content-Length: ")
-        assert b"\r\n\r\n" in encoded
-        assert b'"seq":1' in encoded
+        header, sep, content = encoded.partition(b"\r\n\r\n")
+
+        assert sep
+        assert header.startswith(b"Content-Length: ")
+        assert b'"seq":1' in content
 
     def test_encode_message_with_arguments(self) -> None:
         """Test encoding a message with arguments."""
@@ -32,12 +40,10 @@ class TestEncode:
         }
         encoded = encode_message(data)
 
-        header_end = encoded.index(b"\r\n\r\n")
-        header = encoded[:header_end].decode("utf-8")
-        content = encoded[header_end + 4 :]
+        header, content = _split(encoded)
 
         # Check content length matches
-        length = int(header.split(": ")[1])
+        length = int(header.split(b": ")[1])
         assert len(content) == length
 
 
@@ -99,9 +105,7 @@ class TestRoundTrip:
         original = {"seq": 1, "type": "request", "command": "test"}
         encoded = encode_message(original)
 
-        # Extract content after header
-        header_end = encoded.index(b"\r\n\r\n")
-        content = encoded[header_end + 4 :]
+        _, content = _split(encoded)
 
         decoded = decode_message(content)
         assert decoded == original
@@ -111,8 +115,7 @@ class TestRoundTrip:
         original = {"seq": 1, "type": "event", "event": "output", "body": {"output": "Hello "}}
         encoded = encode_message(original)
 
-        header_end = encoded.index(b"\r\n\r\n")
-        content = encoded[header_end + 4 :]
+        _, content = _split(encoded)
 
         decoded = decode_message(content)
         assert decoded == original
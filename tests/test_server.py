@@ -2,9 +2,26 @@
 
 from __future__ import annotations
 
+import json
+from unittest import mock
+
 import pytest
+from mcp.types import ReadResourceRequest
+from mcp.types import ReadResourceRequestParams
 
+from mcp_dap.dap.messages import DAPEvent
+from mcp_dap.exceptions import DAPTimeoutError
+from mcp_dap.exceptions import MCPDAPError
+from mcp_dap.exceptions import SessionNotFoundError
+from mcp_dap.server import AttachInput
+from mcp_dap.server import LaunchInput
 from mcp_dap.server import MCPDAPServer
+from mcp_dap.server import _error_message
+from mcp_dap.server import _error_response
+from mcp_dap.server import _session_id_arg
+from mcp_dap.server import _session_resources
+from mcp_dap.server import _thread_id_arg
+from mcp_dap.session import DebugSession
 
 
 @pytest.fixture
@@ -13,6 +30,17 @@ def server() -> MCPDAPServer:
     return MCPDAPServer()
 
 
+async def _read_resource(server: MCPDAPServer, uri: str) -> object:
+    """Read a resource through the MCP request handler and decode it."""
+    handler = server.server.request_handlers[ReadResourceRequest]
+    request = ReadResourceRequest(
+        method="resources/read",
+        params=ReadResourceRequestParams(uri=uri),
+    )
+    result = await handler(request)
+    return json.loads(result.root.contents[0].text)
+
+
 def test_server_creation(server: MCPDAPServer) -> None:
     """Test that server can be created."""
     assert server is not None
@@ -29,8 +57,6 @@ def test_server_has_tools(server: MCPDAPServer) -> None:
 
 def test_attach_input_schema() -> None:
     """Test that AttachInput schema has the new fields."""
-    from mcp_dap.server import AttachInput
-
     schema = AttachInput.model_json_schema()
     properties = schema.get("properties", {})
 
@@ -41,3 +67,119 @@ def test_attach_input_schema() -> None:
     required = schema.get("required", [])
     assert "host" not in required
     assert "port" not in required
+
+
+def test_session_id_arg() -> None:
+    """Test that session_id is read directly and must be a string."""
+    assert _session_id_arg({"session_id": "abc"}) == "abc"
+    with pytest.raises(MCPDAPError, match="session_id"):
+        _session_id_arg({})
+    with pytest.raises(MCPDAPError, match="session_id"):
+        _session_id_arg({"session_id": 1})
+
+
+def test_thread_id_arg() -> None:
+    """Test that thread_id is optional and must be an integer."""
+    assert _thread_id_arg({}) is None
+    assert _thread_id_arg({"thread_id": 3}) == 3
+    with pytest.raises(MCPDAPError, match="thread_id"):
+        _thread_id_arg({"thread_id": "3"})
+    with pytest.raises(MCPDAPError, match="thread_id"):
+        _thread_id_arg({"thread_id": True})
+
+
+def test_session_resources() -> None:
+    """Test that per-session resources cover state, threads and breakpoints."""
+    resources = _session_resources("abcdef0123456789")
+    assert [str(r.uri) for r in resources] == [
+        "debug://abcdef0123456789/state",
+        "debug://abcdef0123456789/threads",
+        "debug://abcdef0123456789/breakpoints",
+    ]
+    assert resources[0].name == "Session abcdef01 State"
+
+
+def test_error_message() -> None:
+    """Test that exceptions without a message fall back to their type name."""
+    assert _error_message(SessionNotFoundError("Session not found: x")) == "Session not found: x"
+    assert _error_message(KeyError()) == "KeyError"
+
+
+def test_error_to_dict() -> None:
+    """Test that mcp-dap errors report their message and code."""
+    assert SessionNotFoundError("Session not found: x").to_dict() == {
+        "error": "Session not found: x",
+        "code": "session_not_found",
+    }
+    assert DAPTimeoutError().to_dict() == {"error": "DAPTimeoutError", "code": "dap_timeout"}
+
+
+def test_error_response_reuses_content() -> None:
+    """Test that repeated error messages share serialized content."""
+    first = _error_response("Unknown tool: nope", "error")
+    second = _error_response("Unknown tool: nope", "error")
+    assert first is not second
+    assert first[0] is second[0]
+    assert first[0].text == '{\n  "error": "Unknown tool: nope",\n  "code": "error"\n}'
+
+
+def test_tool_schemas_cached(server: MCPDAPServer) -> None:
+    """Test that every tool's input schema is serialized at registration."""
+    assert len(server._tool_schemas) == len(server._tool_handlers)
+    assert json.loads(server._tool_schemas["debug_launch"]) == LaunchInput.model_json_schema()
+
+
+async def test_read_threads_reuses_payload(server: MCPDAPServer) -> None:
+    """Test that the threads resource is only re-fetched after thread changes."""
+    client = mock.MagicMock()
+    client.threads = mock.AsyncMock(return_value=[{"id": 1, "name": "MainThread"}])
+    session = DebugSession("sid", mock.MagicMock(), client)
+
+    first = await server._read_threads(session)
+    await server._read_threads(session)  # list changed on first fetch
+    assert await server._read_threads(session) == first
+    assert client.threads.await_count == 2
+
+    session._handle_event(DAPEvent(seq=1, event="thread", body={"reason": "started"}))
+    await server._read_threads(session)
+    assert client.threads.await_count == 3
+
+
+async def test_read_tool_schema(server: MCPDAPServer) -> None:
+    """Test reading a tool's input schema resource."""
+    schema = await _read_resource(server, "debug://schema/debug_launch")
+    assert schema == LaunchInput.model_json_schema()
+
+
+async def test_read_unknown_tool_schema(server: MCPDAPServer) -> None:
+    """Test that an unknown tool schema is reported as such."""
+    result = await _read_resource(server, "debug://schema/zzz")
+    assert result == {"error": "Unknown tool schema: zzz"}
+
+
+async def test_get_pending_events_batches(server: MCPDAPServer) -> None:
+    """Test that pending events come back in capped FIFO batches."""
+    session = DebugSession("sid", mock.MagicMock(), mock.MagicMock())
+    server.session_manager._sessions = {"sid": session}
+    for seq in range(300):
+        session._handle_event(DAPEvent(seq=seq, event="custom", body={"n": seq}))
+
+    first = await server._tool_get_pending_events({"session_id": "sid"})
+    assert [e["body"]["n"] for e in first["events"]] == list(range(256))
+    assert first["truncated"] is True
+
+    second = await server._tool_get_pending_events({"session_id": "sid"})
+    assert [e["body"]["n"] for e in second["events"]] == list(range(256, 300))
+    assert second["truncated"] is False
+
+
+async def test_read_session_resources(server: MCPDAPServer) -> None:
+    """Test reading session resources through the MCP request handler."""
+    adapter = mock.MagicMock()
+    adapter.name = "debugpy"
+    session = DebugSession("sid", adapter, mock.MagicMock())
+    server.session_manager._sessions = {"sid": session}
+    expected = session.get_info().model_dump(mode="json")
+
+    assert await _read_resource(server, "debug://sessions") == [expected]
+    assert await _read_resource(server, "debug://sid/state") == expected
@@ -0,0 +1,275 @@
+"""Tests for debug session management."""
+
+from __future__ import annotations
+
+import asyncio
+from unittest import mock
+
+import pytest
+
+from mcp_dap.config import ServerConfig
+from mcp_dap.dap.messages import DAPEvent
+from mcp_dap.exceptions import DAPConnectionError
+from mcp_dap.session import DebugSession
+from mcp_dap.session import SessionManager
+from mcp_dap.types import SessionState
+from mcp_dap.types import StopReason
+
+
+@pytest.fixture
+def session() -> DebugSession:
+    """Create a session backed by a mock DAP client."""
+    adapter = mock.MagicMock()
+    adapter.name = "debugpy"
+    return DebugSession("test-session", adapter, mock.MagicMock())
+
+
+def _output(seq: int, **body: object) -> DAPEvent:
+    """Build a DAP output event."""
+    return DAPEvent(seq=seq, event="output", body=body)
+
+
+def _stopped(seq: int, thread_id: int = 1, reason: str = "breakpoint") -> DAPEvent:
+    """Build a DAP stopped event."""
+    return DAPEvent(seq=seq, event="stopped", body={"reason": reason, "threadId": thread_id})
+
+
+class TestOutputBuffer:
+    """Tests for buffering debuggee output."""
+
+    def test_coalesces_plain_output(self, session: DebugSession) -> None:
+        """Test that consecutive plain output of one category is merged."""
+        session._handle_event(_output(1, category="stdout", output="a\n"))
+        session._handle_event(_output(2, category="stdout", output="b\n"))
+        session._handle_event(_output(3, category="stderr", output="c\n"))
+
+        output = session.get_output()
+        assert [(o.category, o.output) for o in output] == [
+            ("stdout", "a\nb\n"),
+            ("stderr", "c\n"),
+        ]
+
+    def test_keeps_located_output_separate(self, session: DebugSession) -> None:
+        """Test that output carrying a source location is never merged."""
+        session._handle_event(_output(1, category="console", output="a"))
+        session._handle_event(_output(2, category="console", output="b", line=3))
+        session._handle_event(_output(3, category="console", output="c"))
+
+        assert [o.output for o in session.get_output()] == ["a", "b", "c"]
+
+    def test_coalesce_limit(self, session: DebugSession) -> None:
+        """Test that merged output stops growing at the size cap."""
+        chunk = "x" * 40_000
+        session._handle_event(_output(1, category="stdout", output=chunk))
+        session._handle_event(_output(2, category="stdout", output=chunk))
+
+        assert [len(o.output) for o in session.get_output()] == [40_000, 40_000]
+
+    def test_get_output_drains(self, session: DebugSession) -> None:
+        """Test that output is returned once and new output starts fresh."""
+        session._handle_event(_output(1, category="stdout", output="a"))
+        first = session.get_output()
+        session._handle_event(_output(2, category="stdout", output="b"))
+
+        assert [o.output for o in first] == ["a"]
+        assert [o.output for o in session.get_output()] == ["b"]
+
+
+class TestWaitForStop:
+    """Tests for waiting on execution to stop."""
+
+    async def test_stop_before_wait(self, session: DebugSession) -> None:
+        """Test that a stop arriving before the wait starts is not lost."""
+        session._before_resume(None)
+        session._handle_event(_stopped(1, thread_id=2, reason="step"))
+
+        stopped = await session._wait_for_stop(timeout=0)
+
+        assert stopped is not None
+        assert (stopped.thread_id, stopped.reason) == (2, StopReason.STEP)
+
+    async def test_late_stop_is_not_stale(self, session: DebugSession) -> None:
+        """Test that a stop after a timed out wait does not end the next resume."""
+        session.client.continue_execution = mock.AsyncMock()
+        session._before_resume(None)
+        assert await session._wait_for_stop(timeout=0.01) is None
+        session._handle_event(_stopped(1))
+
+        task = asyncio.create_task(session.continue_execution())
+        await asyncio.sleep(0.01)
+        assert not task.done()
+
+        session._handle_event(_stopped(2, thread_id=3))
+        stopped = await task
+
+        assert stopped is not None
+        assert stopped.thread_id == 3
+
+    async def test_continued_mid_wait(self, session: DebugSession) -> None:
+        """Test that a continued event keeps the waiter waiting."""
+        session._before_resume(None)
+        task = asyncio.create_task(session._wait_for_stop())
+        await asyncio.sleep(0)
+
+        session._handle_event(DAPEvent(seq=1, event="continued", body={"threadId": 1}))
+        await asyncio.sleep(0)
+        assert not task.done()
+
+        session._handle_event(_stopped(2, thread_id=4))
+        stopped = await task
+
+        assert stopped is not None
+        assert stopped.thread_id == 4
+
+    async def test_terminated_wakes_waiter(self, session: DebugSession) -> None:
+        """Test that termination ends the wait without a stop."""
+        session._before_resume(None)
+        task = asyncio.create_task(session._wait_for_stop())
+        await asyncio.sleep(0)
+
+        session._handle_event(DAPEvent(seq=1, event="terminated"))
+
+        assert await asyncio.wait_for(task, timeout=1) is None
+
+
+class TestResumeLock:
+    """Tests for serializing resume requests."""
+
+    async def test_concurrent_resumes_run_in_turn(self, session: DebugSession) -> None:
+        """Test that a second resume waits until the first one has stopped."""
+        resume = session.client.continue_execution = mock.AsyncMock()
+        first = asyncio.create_task(session.continue_execution())
+        await asyncio.sleep(0)
+        second = asyncio.create_task(session.continue_execution())
+        await asyncio.sleep(0)
+        assert resume.await_count == 1
+
+        session._handle_event(_stopped(1, thread_id=2))
+        first_stop = await first
+        await asyncio.sleep(0)
+        assert resume.await_count == 2
+        assert not second.done()
+
+        session._handle_event(_stopped(2, thread_id=3))
+        second_stop = await second
+
+        assert first_stop is not None
+        assert first_stop.thread_id == 2
+        assert second_stop is not None
+        assert second_stop.thread_id == 3
+
+    async def test_pause_not_blocked_by_resume(self, session: DebugSession) -> None:
+        """Test that pause goes through while a continue waits for a stop."""
+        session.client.continue_execution = mock.AsyncMock()
+        session.client.pause = mock.AsyncMock()
+        resumed = asyncio.create_task(session.continue_execution())
+        await asyncio.sleep(0)
+
+        await asyncio.wait_for(session.pause(), timeout=1)
+
+        session.client.pause.assert_awaited_once_with(1)
+        assert not resumed.done()
+        session._handle_event(_stopped(1, reason="pause"))
+        stopped = await resumed
+        assert stopped is not None
+        assert stopped.reason == StopReason.PAUSE
+
+
+class TestSessionInfo:
+    """Tests for the cached session info."""
+
+    def test_cached_until_change(self, session: DebugSession) -> None:
+        """Test that unchanged sessions reuse the info object."""
+        assert session.get_info() is session.get_info()
+
+    def test_rebuilt_after_stopped(self, session: DebugSession) -> None:
+        """Test that a stopped event refreshes the info."""
+        before = session.get_info()
+        session._handle_event(_stopped(1, thread_id=2))
+
+        info = session.get_info()
+        assert info is not before
+        assert (info.state, info.stopped_thread_id) == (SessionState.STOPPED, 2)
+        assert info.stop_reason == StopReason.BREAKPOINT
+
+    def test_rebuilt_after_continued(self, session: DebugSession) -> None:
+        """Test that a continued event refreshes the info."""
+        session._handle_event(_stopped(1))
+        before = session.get_info()
+        session._handle_event(DAPEvent(seq=2, event="continued", body={"threadId": 1}))
+
+        info = session.get_info()
+        assert info is not before
+        assert (info.state, info.stopped_thread_id) == (SessionState.RUNNING, None)
+
+    def test_rebuilt_after_terminated(self, session: DebugSession) -> None:
+        """Test that a terminated event refreshes the info."""
+        before = session.get_info()
+        session._handle_event(DAPEvent(seq=1, event="terminated"))
+
+        info = session.get_info()
+        assert info is not before
+        assert info.state == SessionState.TERMINATED
+
+    async def test_rebuilt_after_thread_refresh(self, session: DebugSession) -> None:
+        """Test that a changed thread list refreshes the info."""
+        session.client.threads = mock.AsyncMock(return_value=[{"id": 1, "name": "MainThread"}])
+        before = session.get_info()
+        await session.get_threads()
+
+        info = session.get_info()
+        assert info is not before
+        assert [(t.id, t.name) for t in info.threads] == [(1, "MainThread")]
+
+        await session.get_threads()
+        assert session.get_info() is info
+
+
+class TestSessionManager:
+    """Tests for SessionManager."""
+
+    async def test_close_all_closes_every_session(self) -> None:
+        """Test that one failing disconnect does not stop the others."""
+        manager = SessionManager(ServerConfig())
+        failing = mock.MagicMock()
+        failing.disconnect = mock.AsyncMock(side_effect=DAPConnectionError("gone"))
+        healthy = mock.MagicMock()
+        healthy.disconnect = mock.AsyncMock()
+        manager._sessions = {"a": failing, "b": healthy}
+
+        with pytest.raises(DAPConnectionError, match="gone"):
+            await manager.close_all()
+
+        healthy.disconnect.assert_awaited_once_with(terminate=True)
+        assert manager.list_session_ids() == []
+
+    def test_list_session_states(self, session: DebugSession) -> None:
+        """Test listing session IDs with their states."""
+        manager = SessionManager(ServerConfig())
+        manager._sessions = {session.session_id: session}
+
+        assert manager.list_session_states() == [("test-session", SessionState.INITIALIZING)]
+
+
+class TestBreakpoints:
+    """Tests for breakpoint management."""
+
+    async def test_clear_unknown_file_skips_adapter(self, session: DebugSession) -> None:
+        """Test that clearing a file without breakpoints sends no request."""
+        session.client.set_breakpoints = mock.AsyncMock()
+
+        await session.clear_breakpoints("/never/set.py")
+
+        session.client.set_breakpoints.assert_not_awaited()
+
+    async def test_clear_known_file(self, session: DebugSession) -> None:
+        """Test that clearing a file with breakpoints sends an empty set."""
+        session.client.set_breakpoints = mock.AsyncMock(
+            return_value=[{"id": 1, "verified": True, "line": 3}]
+        )
+        await session.set_breakpoints("/a.py", [{"line": 3}])
+
+        await session.clear_breakpoints("/a.py")
+
+        session.client.set_breakpoints.assert_awaited_with("/a.py", [])
+        assert session.breakpoints == {}
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from mcp_dap.types import Breakpoint
 from mcp_dap.types import SessionState
+from mcp_dap.types import Source
 from mcp_dap.types import StackFrame
 from mcp_dap.types import StopReason
 from mcp_dap.types import Variable
@@ -55,6 +56,19 @@ class TestBreakpoint:
         assert bp.source_path == "/test.py"
 
 
+class TestSource:
+    """Tests for Source type."""
+
+    def test_from_dap(self) -> None:
+        """Test converting a DAP source object."""
+        source = Source.from_dap({"name": "a.py", "path": "/a.py", "sourceReference": 3})
+        assert source == Source(name="a.py", path="/a.py", source_reference=3)
+
+    def test_from_dap_missing(self) -> None:
+        """Test that a missing DAP source stays None."""
+        assert Source.from_dap(None) is None
+
+
 class TestStackFrame:
     """Tests for StackFrame model."""
 